@@ -17,12 +17,15 @@ This helps you:
 - Review which tests to keep
 """
 
+import calendar
 import os
 import re
 import shutil
-from datetime import datetime
+import sys
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 
 
 def parse_filename(filename):
@@ -36,7 +39,7 @@ def parse_filename(filename):
         return None
     
     # Remove .txt extension
-    name = filename.replace('.txt', '')
+    name = filename[:-4]
     
     # Split by underscores
     parts = name.split('_')
@@ -51,68 +54,83 @@ def parse_filename(filename):
     return None
 
 
+# Precomputed normalized forms of the common 1-2 digit student IDs ('01' -> '1')
+_ID_CACHE = {key: str(i) for i in range(100) for key in (str(i), f"{i:02d}")}
+
+
 def normalize_student_id(student_id):
     """
     Normalize student ID for comparison.
     '1' and '01' should be considered the same student.
     """
+    # Common short IDs are a single lookup
+    cached = _ID_CACHE.get(student_id)
+    if cached is not None:
+        return cached
+    
     # If it's numeric, remove leading zeros for comparison
     if student_id.isdigit():
         return str(int(student_id))
     return student_id
 
 
-def get_timestamp_for_sorting(timestamp_str):
+def normalize_ts(timestamp_str):
     """
-    Convert timestamp string to datetime for sorting.
+    Normalize timestamp string to a sortable YYYYMMDDHHMM string.
     Handles both YYYY.MM.DD.HHMM and YY.MM.DD.HHMM formats.
-    Returns datetime object or current time if parsing fails.
+    Plain string comparison then orders timestamps chronologically.
+    Returns '' if parsing fails or the date/time is out of range.
     """
-    try:
-        parts = timestamp_str.split('.')
-        if len(parts) == 4:
-            year, month, day, time = parts
-            
-            # Determine if year is YY or YYYY
-            if len(year) == 2:
-                year = '20' + year  # Assume 20xx
-            
-            # Extract hour and minute from time (HHMM)
-            if len(time) >= 4:
-                hour = time[:2]
-                minute = time[2:4]
-            else:
-                hour = '00'
-                minute = '00'
-            
-            # Create datetime
-            dt = datetime(int(year), int(month), int(day), int(hour), int(minute))
-            return dt
-    except:
-        pass
+    parts = timestamp_str.split('.')
+    if len(parts) == 4 and all(p.isdecimal() for p in parts):
+        year, month, day, time = parts
+        
+        # Determine if year is YY or YYYY
+        if len(year) == 2:
+            year = '20' + year  # Assume 20xx
+        
+        # Hour and minute from time (HHMM)
+        if len(time) < 4:
+            time = '0000'
+        
+        year, month, day = int(year), int(month), int(day)
+        hour, minute = int(time[:2]), int(time[2:4])
+        
+        # Same range checks datetime() would apply, so e.g. month 13 is unparseable
+        if (1 <= year <= 9999 and 1 <= month <= 12
+                and 1 <= day <= calendar.monthrange(year, month)[1]
+                and hour < 24 and minute < 60):
+            return f"{year:04d}{month:02d}{day:02d}{hour:02d}{minute:02d}"
     
-    # If parsing fails, return a very old date so it gets moved as duplicate
-    return datetime(1900, 1, 1)
+    # If parsing fails, sort before everything so it gets moved as duplicate
+    return ''
 
 
 def find_duplicates_in_folder(class_folder):
     """
     Find duplicate test files in a single class folder.
-    Returns: list of tuples (filepath, class_num, student_id, timestamp, is_duplicate)
+    Returns: (duplicates, dup_count, student_groups)
+    duplicates = [(filepath, filename, class_num, student_id, timestamp, is_duplicate), ...]
+    dup_count = number of files to move (all but the newest per student)
+    student_groups = {student_id: [(filename, timestamp, is_duplicate), ...]} for display
     """
     # Dictionary to group files by (class_number, normalized_student_id)
     student_files = defaultdict(list)
     
-    # Collect all test files
-    for filename in os.listdir(class_folder):
-        filepath = os.path.join(class_folder, filename)
-        
+    # Collect all test files (scandir reuses the directory entry type info)
+    with os.scandir(class_folder) as it:
+        entries = list(it)
+    
+    for entry in entries:
         # Skip directories
-        if not os.path.isfile(filepath):
+        if not entry.is_file(follow_symlinks=False):
             continue
         
+        filename = entry.name
+        filepath = entry.path
+        
         # Skip processed files
-        if '_PROCESSED.txt' in filename:
+        if filename.endswith('_PROCESSED.txt'):
             continue
         
         # Parse filename
@@ -125,68 +143,106 @@ def find_duplicates_in_folder(class_folder):
         # Normalize student ID for comparison
         normalized_id = normalize_student_id(student_id)
         
-        # Group by (class, student)
+        # Group by (class, student) - sortable timestamp first so tuples sort by it
         key = (class_number, normalized_id)
-        student_files[key].append({
-            'filepath': filepath,
-            'filename': filename,
-            'class': class_number,
-            'student_id': student_id,
-            'timestamp': timestamp,
-            'datetime': get_timestamp_for_sorting(timestamp)
-        })
+        student_files[key].append(
+            (normalize_ts(timestamp), filepath, filename, class_number, student_id, timestamp)
+        )
     
-    # Find duplicates
+    # Find duplicates, counting and grouping them in the same pass
     duplicates = []
+    dup_count = 0
+    student_groups = defaultdict(list)
     
     for key, files in student_files.items():
         if len(files) > 1:
-            # Multiple files for same student - sort by datetime (oldest first)
-            files.sort(key=lambda x: x['datetime'])
+            # Multiple files for same student - sort by timestamp (oldest first)
+            files.sort()
             
             # All but the newest are duplicates
-            for i, file_info in enumerate(files):
+            for i, (_, filepath, filename, class_number, student_id, timestamp) in enumerate(files):
                 is_duplicate = (i < len(files) - 1)  # All except last (newest) are duplicates
-                duplicates.append((
-                    file_info['filepath'],
-                    file_info['filename'],
-                    file_info['class'],
-                    file_info['student_id'],
-                    file_info['timestamp'],
-                    is_duplicate
-                ))
+                duplicates.append((filepath, filename, class_number, student_id, timestamp, is_duplicate))
+                student_groups[student_id].append((filename, timestamp, is_duplicate))
+                if is_duplicate:
+                    dup_count += 1
     
-    return duplicates
+    return duplicates, dup_count, student_groups
 
 
-def move_duplicates(duplicates, duplicates_folder):
+def unique_dest_name(filename, existing_names):
+    """
+    Pick a name not yet in existing_names, adding _dupN if needed.
+    The chosen name is added to existing_names.
+    """
+    dest_name = filename
+    
+    # If file already exists in Duplicates, add a number
+    if dest_name in existing_names:
+        base, ext = os.path.splitext(filename)
+        counter = 1
+        while dest_name in existing_names:
+            dest_name = f"{base}_dup{counter}{ext}"
+            counter += 1
+    
+    existing_names.add(dest_name)
+    return dest_name
+
+
+def move_file(src, dest):
+    """
+    Move a file with a single rename when possible.
+    Falls back to shutil.move if the rename fails (e.g. across drives).
+    """
+    try:
+        os.replace(src, dest)
+    except OSError:
+        shutil.move(src, dest)
+
+
+def scan_existing_names(folder):
+    """Names of entries in folder, or an empty set if it doesn't exist yet"""
+    try:
+        with os.scandir(folder) as it:
+            return {e.name for e in it}
+    except FileNotFoundError:
+        return set()
+
+
+def move_duplicates(duplicates, duplicates_folder, existing_names=None):
     """
     Move duplicate files to the Duplicates folder.
+    existing_names: set of names already in the Duplicates folder (scanned if None)
     Returns: count of files moved
     """
     moved_count = 0
+    out = []
+    folder_ready = False
+    
+    if existing_names is None:
+        existing_names = scan_existing_names(duplicates_folder)
     
     for filepath, filename, class_num, student_id, timestamp, is_duplicate in duplicates:
         if is_duplicate:
-            # Create destination path
-            dest_path = os.path.join(duplicates_folder, filename)
+            # Only create the Duplicates folder once something is moved into it
+            if not folder_ready:
+                Path(duplicates_folder).mkdir(parents=True, exist_ok=True)
+                folder_ready = True
             
-            # If file already exists in Duplicates, add a number
-            if os.path.exists(dest_path):
-                base, ext = os.path.splitext(filename)
-                counter = 1
-                while os.path.exists(dest_path):
-                    dest_path = os.path.join(duplicates_folder, f"{base}_dup{counter}{ext}")
-                    counter += 1
+            # Create destination path
+            dest_path = os.path.join(duplicates_folder, unique_dest_name(filename, existing_names))
             
             # Move the file
             try:
-                shutil.move(filepath, dest_path)
-                print(f"  ✓ Moved: {filename}")
-                print(f"    → Class {class_num}, Student {student_id}, {timestamp}")
+                move_file(filepath, dest_path)
+                out.append(f"  ✓ Moved: {filename}\n")
+                out.append(f"    → Class {class_num}, Student {student_id}, {timestamp}\n")
                 moved_count += 1
             except Exception as e:
-                print(f"  ✗ Error moving {filename}: {e}")
+                out.append(f"  ✗ Error moving {filename}: {e}\n")
+    
+    # Print the whole batch at once
+    sys.stdout.write(''.join(out))
     
     return moved_count
 
@@ -207,56 +263,51 @@ def main():
         input("\nPress Enter to exit...")
         return
     
-    # Create Duplicates folder
+    # Duplicates folder is created on the first move
     duplicates_folder = os.path.join(records_dir, "Duplicates")
-    Path(duplicates_folder).mkdir(parents=True, exist_ok=True)
     
     print(f"\nScanning for duplicates in: {records_dir}")
     print(f"Duplicates will be moved to: {duplicates_folder}\n")
     
+    # Names already in Duplicates, kept up to date as files are moved
+    existing_names = scan_existing_names(duplicates_folder)
+    
     total_duplicates_found = 0
     total_files_moved = 0
     classes_processed = 0
     
+    # Collect class folders, skipping the Duplicates folder itself
+    with os.scandir(records_dir) as it:
+        class_dirs = sorted((e.path, e.name) for e in it
+                            if e.name != "Duplicates" and e.is_dir())
+    
+    # Scan class folders in parallel; moves into the shared Duplicates
+    # folder happen below, one class at a time
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(find_duplicates_in_folder,
+                                    [path for path, _ in class_dirs]))
+    
     # Process each class folder
-    for item in sorted(os.listdir(records_dir)):
-        item_path = os.path.join(records_dir, item)
-        
-        # Skip the Duplicates folder itself
-        if item == "Duplicates":
-            continue
-        
-        # Only process directories
-        if not os.path.isdir(item_path):
-            continue
-        
+    for (item_path, item), (duplicates, dup_count, student_groups) in zip(class_dirs, results):
         classes_processed += 1
         print(f"Processing class: {item}")
         
-        # Find duplicates in this folder
-        duplicates = find_duplicates_in_folder(item_path)
-        
         if duplicates:
-            # Count how many are actually duplicates (not the kept newest one)
-            dup_count = sum(1 for _, _, _, _, _, is_dup in duplicates if is_dup)
-            
+            # Only count actual duplicates (not the kept newest one)
             if dup_count > 0:
                 total_duplicates_found += dup_count
                 
-                # Show what was found
-                # Group by student to show clearly
-                student_groups = defaultdict(list)
-                for filepath, filename, class_num, student_id, timestamp, is_dup in duplicates:
-                    student_groups[student_id].append((filename, timestamp, is_dup))
-                
+                # Show what was found, grouped by student to show clearly
+                out = []
                 for student_id, files in student_groups.items():
-                    print(f"\n  Student {student_id}: {len(files)} tests found")
-                    for filename, timestamp, is_dup in sorted(files, key=lambda x: x[1]):
+                    out.append(f"\n  Student {student_id}: {len(files)} tests found\n")
+                    for filename, timestamp, is_dup in sorted(files, key=itemgetter(1)):
                         status = "→ MOVING (older)" if is_dup else "✓ KEEPING (newest)"
-                        print(f"    {status}: {timestamp}")
+                        out.append(f"    {status}: {timestamp}\n")
+                sys.stdout.write(''.join(out))
                 
                 # Move the duplicates
-                moved = move_duplicates(duplicates, duplicates_folder)
+                moved = move_duplicates(duplicates, duplicates_folder, existing_names)
                 total_files_moved += moved
                 print()
         else:
@@ -18,9 +18,37 @@ This ensures all records are properly formatted and class summaries are complete
 
 import os
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from find_duplicates import move_file, scan_existing_names, unique_dest_name
+
+
+# Precompiled patterns for parsing test files
+_Q_RE = re.compile(r'Question\s+(\d+):\s+(\d+)\s+=\s+([\d\s]+)\s+(.+)')
+_SCALE_RE = re.compile(r'(\d+)\s*=\s*(.+)')
+_SCORE_RE = re.compile(r'Score:\s*(\d+)')
+_MAX_RE = re.compile(r'Max Score:\s*(\d+)')
+_PCT_RE = re.compile(r'Percentage:\s*(\d+)%')
+
+# Separator line marking the header / point scale section
+HEADER_MARK = '=' * 20
+
+# Suffixes of test files that are not scored (originals and already-processed files)
+_SKIP_SUFFIXES = ('_Unprocessed.txt', '_PROCESSED.txt')
+
+# Number of leading lines searched for a header before treating a file as incomplete
+HEADER_SCAN_LINES = 20
+
+
+def is_test_filename(filename):
+    """Check if filename is a SpeakingTest_*.txt record that should be scored"""
+    return (filename.startswith('SpeakingTest_') and filename.endswith('.txt')
+            and not filename.endswith(_SKIP_SUFFIXES))
 
 
 def parse_incomplete_test(filepath):
@@ -33,28 +61,30 @@ def parse_incomplete_test(filepath):
     has_header = False
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(filepath, 'r', encoding='utf-8', buffering=1 << 16) as f:
+            lines_scanned = 0
+            for line in f:
+                # Check if file has header (look for "=" line or "Total Questions:")
+                # A header is always at the top, so only the first lines are checked
+                if lines_scanned < HEADER_SCAN_LINES:
+                    if HEADER_MARK in line or 'Total Questions:' in line or 'Student:' in line:
+                        has_header = True
+                        return [], has_header
+                    lines_scanned += 1
+                
+                # Parse question lines
+                # Format: Question 00: 5 = 1 0 0 0 0 intro
+                line = line.strip()
+                if line.startswith('Question'):
+                    match = _Q_RE.match(line)
+                    if match:
+                        q_num = int(match.group(1))
+                        points = int(match.group(2))
+                        binary = match.group(3).strip()
+                        filename = match.group(4).strip()
+                        questions.append((q_num, points, binary, filename))
     except:
-        return questions, True  # Can't read, skip it
-    
-    # Check if file has header (look for "=" line or "Total Questions:")
-    if '=' * 20 in content or 'Total Questions:' in content or 'Student:' in content:
-        has_header = True
-        return questions, has_header
-    
-    # Parse question lines
-    # Format: Question 00: 5 = 1 0 0 0 0 intro
-    for line in content.split('\n'):
-        line = line.strip()
-        if line.startswith('Question'):
-            match = re.match(r'Question\s+(\d+):\s+(\d+)\s+=\s+([\d\s]+)\s+(.+)', line)
-            if match:
-                q_num = int(match.group(1))
-                points = int(match.group(2))
-                binary = match.group(3).strip()
-                filename = match.group(4).strip()
-                questions.append((q_num, points, binary, filename))
+        return [], True  # Can't read, skip it
     
     return questions, has_header
 
@@ -92,37 +122,45 @@ def calculate_score(questions):
 def get_point_scale_from_directory(class_folder):
     """
     Get point scale from any complete test file in the directory.
+    Results are cached per folder, so repeat calls are a dict lookup.
     Returns dict: {position: (points, 'name'), ...}
     """
+    return _get_point_scale_cached(os.path.abspath(class_folder))
+
+
+@lru_cache(maxsize=None)
+def _get_point_scale_cached(class_folder):
+    """Uncached point scale lookup for an absolute class folder path"""
     point_scale = {}
     
+    with os.scandir(class_folder) as it:
+        entries = list(it)
+    
     # Look for any file with a header
-    for file in os.listdir(class_folder):
-        if file.endswith('.txt') and file.startswith('SpeakingTest_'):
-            filepath = os.path.join(class_folder, file)
+    for entry in entries:
+        file = entry.name
+        if file.endswith('.txt') and file.startswith('SpeakingTest_') and entry.is_file():
+            filepath = entry.path
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Check if it has point scale
-                lines = content.split('\n')
-                in_scale_section = False
-                for line in lines:
-                    if '=' * 20 in line and in_scale_section:
-                        break
-                    if '=' * 20 in line:
-                        in_scale_section = True
-                        continue
-                    
-                    if in_scale_section and '=' in line and 'Total Questions' not in line:
-                        # Parse: "5 = Correct"
-                        match = re.match(r'(\d+)\s*=\s*(.+)', line.strip())
-                        if match:
-                            points = int(match.group(1))
-                            name = match.group(2).strip()
-                            if not any(p == points for p in [v[0] for v in point_scale.values()]):
-                                position = len(point_scale) + 1
-                                point_scale[position] = (points, name)
+                with open(filepath, 'r', encoding='utf-8', buffering=1 << 16) as f:
+                    # Check if it has point scale - stop reading at the closing separator
+                    in_scale_section = False
+                    for line in f:
+                        if HEADER_MARK in line and in_scale_section:
+                            break
+                        if HEADER_MARK in line:
+                            in_scale_section = True
+                            continue
+                        
+                        if in_scale_section and '=' in line and 'Total Questions' not in line:
+                            # Parse: "5 = Correct"
+                            match = _SCALE_RE.match(line.strip())
+                            if match:
+                                points = int(match.group(1))
+                                name = match.group(2).strip()
+                                if not any(p == points for p in [v[0] for v in point_scale.values()]):
+                                    position = len(point_scale) + 1
+                                    point_scale[position] = (points, name)
                 
                 if point_scale:
                     return point_scale
@@ -139,7 +177,7 @@ def extract_info_from_filename(filename):
     Format: SpeakingTest_CLASS_STUDENTID_TIMESTAMP.txt
     Returns: (class_number, student_id, timestamp_str)
     """
-    name = filename.replace('.txt', '')
+    name = filename[:-4] if filename.endswith('.txt') else filename
     parts = name.split('_')
     
     if len(parts) >= 4 and parts[0] == 'SpeakingTest':
@@ -150,13 +188,14 @@ def extract_info_from_filename(filename):
 
 def generate_complete_report(original_file, questions, class_number, student_id, 
                             timestamp_str, total_score, max_score, percentage, 
-                            total_questions, point_scale):
+                            total_questions, point_scale, source_file=None):
     """
     Generate a complete report file with header.
+    Content is read from source_file (the renamed original) if given.
     Returns path to new file.
     """
     # Read original content
-    with open(original_file, 'r', encoding='utf-8') as f:
+    with open(source_file or original_file, 'r', encoding='utf-8') as f:
         original_content = f.read()
     
     # Build header
@@ -187,54 +226,105 @@ def generate_complete_report(original_file, questions, class_number, student_id,
     return original_file
 
 
-def compile_class_summary(class_folder, class_number):
+def find_unprocessed_files(folder):
+    """
+    List *_Unprocessed.txt originals left in a class folder.
+    Returns: [(unprocessed_path, unprocessed_name), ...], empty if unreadable
+    """
+    try:
+        with os.scandir(folder) as it:
+            return sorted((e.path, e.name) for e in it
+                          if e.name.startswith('SpeakingTest_')
+                          and e.name.endswith('_Unprocessed.txt') and e.is_file())
+    except OSError:
+        return []
+
+
+def move_unprocessed(unprocessed_files, duplicates_folder, existing_names):
+    """
+    Move unprocessed originals into the Duplicates folder.
+    Returns: list of output lines for any files that could not be moved
+    """
+    out = []
+    if unprocessed_files:
+        Path(duplicates_folder).mkdir(parents=True, exist_ok=True)
+    
+    for unprocessed_path, unprocessed_name in unprocessed_files:
+        dest_name = unique_dest_name(unprocessed_name, existing_names)
+        dest_path = os.path.join(duplicates_folder, dest_name)
+        try:
+            move_file(unprocessed_path, dest_path)
+        except Exception as e:
+            out.append(f"  ✗ Error moving {unprocessed_name}: {e}\n")
+    
+    return out
+
+
+def compile_class_summary(class_folder, class_number, precomputed_entries=None, filenames=None):
     """
     Compile or update class summary file for a class.
+    precomputed_entries: entries (with 'filename') already known from processing,
+                         used instead of re-reading those files
+    filenames: test filenames already listed by the caller, to skip re-listing
     Returns: (summary_file_path, entries_added)
     """
     # Collect all test files and their scores
     test_entries = []
     
-    for filename in os.listdir(class_folder):
-        if not filename.startswith('SpeakingTest_') or not filename.endswith('.txt'):
+    known_entries = {}
+    if precomputed_entries:
+        known_entries = {entry['filename']: entry for entry in precomputed_entries}
+    
+    if filenames is None:
+        with os.scandir(class_folder) as it:
+            filenames = [e.name for e in it if e.is_file()]
+    
+    for filename in filenames:
+        if not is_test_filename(filename):
             continue
         
-        if '_Unprocessed.txt' in filename or '_PROCESSED.txt' in filename:
+        # Already scored during processing - no need to open it again
+        if filename in known_entries:
+            test_entries.append(known_entries[filename])
             continue
         
         filepath = os.path.join(class_folder, filename)
         
         # Parse file to get score
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
             # Extract info from header
             student_id = None
             student_name = ""
             total_score = 0
             max_score = 0
             percentage = 0
+            seen_scores = False
             
-            # Parse header
-            for line in content.split('\n'):
-                if line.startswith('Student:'):
-                    # Format: "Student: 01" or "Student: 01 Name"
-                    parts = line.replace('Student:', '').strip().split(' ', 1)
-                    student_id = parts[0]
-                    student_name = parts[1] if len(parts) > 1 else ""
-                elif 'Total Questions:' in line and 'Score:' in line:
-                    # Parse: Total Questions: 10   Max Score: 50   Score: 41   Percentage: 82%
-                    score_match = re.search(r'Score:\s*(\d+)', line)
-                    max_match = re.search(r'Max Score:\s*(\d+)', line)
-                    pct_match = re.search(r'Percentage:\s*(\d+)%', line)
+            # Parse header - stop once both header lines have been read
+            with open(filepath, 'r', encoding='utf-8', buffering=1 << 16) as f:
+                for line in f:
+                    line = line.rstrip('\n')
+                    if line.startswith('Student:'):
+                        # Format: "Student: 01" or "Student: 01 Name"
+                        parts = line.replace('Student:', '').strip().split(' ', 1)
+                        student_id = parts[0]
+                        student_name = parts[1] if len(parts) > 1 else ""
+                    elif 'Total Questions:' in line and 'Score:' in line:
+                        # Parse: Total Questions: 10   Max Score: 50   Score: 41   Percentage: 82%
+                        score_match = _SCORE_RE.search(line)
+                        max_match = _MAX_RE.search(line)
+                        pct_match = _PCT_RE.search(line)
+                        
+                        if score_match:
+                            total_score = int(score_match.group(1))
+                        if max_match:
+                            max_score = int(max_match.group(1))
+                        if pct_match:
+                            percentage = int(pct_match.group(1))
+                        seen_scores = True
                     
-                    if score_match:
-                        total_score = int(score_match.group(1))
-                    if max_match:
-                        max_score = int(max_match.group(1))
-                    if pct_match:
-                        percentage = int(pct_match.group(1))
+                    if student_id and seen_scores:
+                        break
             
             # Get timestamp from filename
             _, _, timestamp_str = extract_info_from_filename(filename)
@@ -274,27 +364,105 @@ def compile_class_summary(class_folder, class_number):
     # Create summary file
     summary_file = os.path.join(class_folder, f"{class_number}_SpeakingTest.{date_str}.txt")
     
-    # Write summary
+    # Build summary
+    lines = [
+        f"Class {class_number} - Speaking Test Summary\n",
+        f"Date: 20{date_str.replace('.', '-')}\n",
+        "=" * 80 + "\n\n",
+    ]
+    
+    # Add entries
+    for entry in test_entries:
+        student_display = entry['student_id'].zfill(2) if entry['student_id'].isdigit() else entry['student_id'].ljust(2)
+        name_display = entry['student_name'].ljust(20)[:20] if entry['student_name'] else "".ljust(20)
+        score_display = f"{entry['total_score']}/{entry['max_score']}".rjust(10)
+        percent_display = f"{entry['percentage']}%".rjust(5)
+        
+        # Extract time from timestamp
+        ts_parts = entry['timestamp'].split('.')
+        time_part = ts_parts[-1][:4] if len(ts_parts) >= 4 else "0000"
+        
+        lines.append(f"{date_str}.{time_part}:   Student {student_display} {name_display}:  {score_display} = {percent_display}\n")
+    
+    # Write summary in one go
     with open(summary_file, 'w', encoding='utf-8') as f:
-        f.write(f"Class {class_number} - Speaking Test Summary\n")
-        f.write(f"Date: 20{date_str.replace('.', '-')}\n")
-        f.write("=" * 80 + "\n\n")
+        f.write(''.join(lines))
+    
+    return summary_file, len(test_entries)
+
+
+def process_class(item_path, item):
+    """
+    Complete incomplete tests and compile the summary for one class folder.
+    Runs in a worker process, so moving the unprocessed originals into the
+    shared Duplicates folder is left to the caller.
+    Returns: (output_lines, unprocessed_files, summary_file, entries)
+    unprocessed_files = [(unprocessed_path, unprocessed_name), ...]
+    """
+    # Get point scale for this class
+    point_scale = get_point_scale_from_directory(item_path)
+    
+    out = []
+    unprocessed_files = []
+    
+    # Scores of tests completed below, fed straight into the class summary
+    class_entries = []
+    
+    # List the class folder once; the summary reuses this listing.
+    # Names are sorted as plain strings since summary rows follow this order
+    with os.scandir(item_path) as it:
+        class_filenames = sorted(e.name for e in it if e.is_file())
+    
+    for filename in class_filenames:
+        if not is_test_filename(filename):
+            continue
+        
+        filepath = os.path.join(item_path, filename)
+        
+        # Check if incomplete
+        questions, has_header = parse_incomplete_test(filepath)
         
-        # Write entries
-        for entry in test_entries:
-            student_display = entry['student_id'].zfill(2) if entry['student_id'].isdigit() else entry['student_id'].ljust(2)
-            name_display = entry['student_name'].ljust(20)[:20] if entry['student_name'] else "".ljust(20)
-            score_display = f"{entry['total_score']}/{entry['max_score']}".rjust(10)
-            percent_display = f"{entry['percentage']}%".rjust(5)
+        if not has_header and questions:
+            # This is an incomplete test - process it
+            class_number, student_id, timestamp_str = extract_info_from_filename(filename)
+            
+            if not class_number or not student_id:
+                continue
             
-            # Extract time from timestamp
-            ts_parts = entry['timestamp'].split('.')
-            time_part = ts_parts[-1][:4] if len(ts_parts) >= 4 else "0000"
+            # Calculate score
+            total_score, max_score, percentage, total_questions = calculate_score(questions)
             
-            line = f"{date_str}.{time_part}:   Student {student_display} {name_display}:  {score_display} = {percent_display}\n"
-            f.write(line)
+            # Rename original to *_Unprocessed.txt
+            unprocessed_name = filename[:-4] + '_Unprocessed.txt'
+            unprocessed_path = os.path.join(item_path, unprocessed_name)
+            os.rename(filepath, unprocessed_path)
+            
+            # Generate complete report (recreate with original filename)
+            generate_complete_report(
+                filepath, questions, class_number, student_id, timestamp_str,
+                total_score, max_score, percentage, total_questions, point_scale,
+                source_file=unprocessed_path
+            )
+            
+            class_entries.append({
+                'filename': filename,
+                'student_id': student_id,
+                'student_name': "",
+                'total_score': total_score,
+                'max_score': max_score,
+                'percentage': percentage,
+                'timestamp': timestamp_str
+            })
+            
+            unprocessed_files.append((unprocessed_path, unprocessed_name))
+            out.append(f"  ✓ Completed: Student {student_id} - {total_score}/{max_score} = {percentage}%\n")
     
-    return summary_file, len(test_entries)
+    # Compile class summary
+    summary_file, entries = compile_class_summary(
+        item_path, item, precomputed_entries=class_entries, filenames=class_filenames
+    )
+    
+    return out, unprocessed_files, summary_file, entries
 
 
 def main():
@@ -311,92 +479,64 @@ def main():
         input("\nPress Enter to exit...")
         return
     
-    # Create Duplicates folder
+    # Duplicates folder is created on the first move
     duplicates_folder = os.path.join(records_dir, "Duplicates")
-    Path(duplicates_folder).mkdir(parents=True, exist_ok=True)
     
     print(f"\nProcessing records in: {records_dir}\n")
     
+    # Names already in Duplicates, kept up to date as files are moved
+    existing_names = scan_existing_names(duplicates_folder)
+    
     total_incomplete = 0
     total_processed = 0
     total_summaries = 0
     
-    # Process each class folder
-    for item in sorted(os.listdir(records_dir)):
-        item_path = os.path.join(records_dir, item)
-        
-        if item == "Duplicates" or not os.path.isdir(item_path):
-            continue
-        
-        print(f"Processing class: {item}")
-        
-        # Get point scale for this class
-        point_scale = get_point_scale_from_directory(item_path)
-        
-        incomplete_in_class = 0
+    # Collect class folders
+    with os.scandir(records_dir) as it:
+        class_dirs = sorted((e.path, e.name) for e in it
+                            if e.name != "Duplicates" and e.is_dir())
+    
+    # Class folders are independent, so process them in parallel; results are
+    # reported (and originals moved) in class order, each as soon as it's ready
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(process_class, item_path, item)
+                   for item_path, item in class_dirs]
         
-        # Process each test file
-        for filename in sorted(os.listdir(item_path)):
-            if not filename.startswith('SpeakingTest_') or not filename.endswith('.txt'):
-                continue
+        for (item_path, item), future in zip(class_dirs, futures):
+            print(f"Processing class: {item}")
             
-            if '_Unprocessed.txt' in filename or '_PROCESSED.txt' in filename:
+            try:
+                out, unprocessed_files, summary_file, entries = future.result()
+            except Exception as e:
+                # Originals renamed before the failure still belong in Duplicates,
+                # otherwise later runs would skip them for good
+                print(f"  ✗ Error processing class {item}: {e}")
+                stranded = find_unprocessed_files(item_path)
+                errors = move_unprocessed(stranded, duplicates_folder, existing_names)
+                sys.stdout.write(''.join(errors))
+                if len(stranded) > len(errors):
+                    print(f"  → Moved {len(stranded) - len(errors)} unprocessed original(s) to Duplicates")
+                print()
                 continue
             
-            filepath = os.path.join(item_path, filename)
+            # Move unprocessed to Duplicates
+            out += move_unprocessed(unprocessed_files, duplicates_folder, existing_names)
             
-            # Check if incomplete
-            questions, has_header = parse_incomplete_test(filepath)
+            # Print the per-file results in one batch
+            sys.stdout.write(''.join(out))
             
-            if not has_header and questions:
-                # This is an incomplete test - process it
-                class_number, student_id, timestamp_str = extract_info_from_filename(filename)
-                
-                if not class_number or not student_id:
-                    continue
-                
-                # Calculate score
-                total_score, max_score, percentage, total_questions = calculate_score(questions)
-                
-                # Rename original to *_Unprocessed.txt
-                unprocessed_name = filename.replace('.txt', '_Unprocessed.txt')
-                unprocessed_path = os.path.join(item_path, unprocessed_name)
-                os.rename(filepath, unprocessed_path)
-                
-                # Generate complete report (recreate with original filename)
-                generate_complete_report(
-                    filepath, questions, class_number, student_id, timestamp_str,
-                    total_score, max_score, percentage, total_questions, point_scale
-                )
-                
-                # Move unprocessed to Duplicates
-                dest_path = os.path.join(duplicates_folder, unprocessed_name)
-                if os.path.exists(dest_path):
-                    base, ext = os.path.splitext(unprocessed_name)
-                    counter = 1
-                    while os.path.exists(dest_path):
-                        dest_path = os.path.join(duplicates_folder, f"{base}_dup{counter}{ext}")
-                        counter += 1
-                
-                import shutil
-                shutil.move(unprocessed_path, dest_path)
-                
-                print(f"  ✓ Completed: Student {student_id} - {total_score}/{max_score} = {percentage}%")
-                incomplete_in_class += 1
-                total_processed += 1
-        
-        if incomplete_in_class > 0:
-            total_incomplete += incomplete_in_class
-            print(f"  → Processed {incomplete_in_class} incomplete test(s)")
-        
-        # Compile class summary
-        summary_file, entries = compile_class_summary(item_path, item)
-        
-        if summary_file:
-            print(f"  ✓ Compiled summary: {os.path.basename(summary_file)} ({entries} students)")
-            total_summaries += 1
-        
-        print()
+            incomplete_in_class = len(unprocessed_files)
+            total_processed += incomplete_in_class
+            
+            if incomplete_in_class > 0:
+                total_incomplete += incomplete_in_class
+                print(f"  → Processed {incomplete_in_class} incomplete test(s)")
+            
+            if summary_file:
+                print(f"  ✓ Compiled summary: {os.path.basename(summary_file)} ({entries} students)")
+                total_summaries += 1
+            
+            print()
     
     # Summary
     print("=" * 80)
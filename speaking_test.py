@@ -9,13 +9,120 @@ Double-click this file to run the application (no batch file needed).
 
 import tkinter as tk
 from tkinter import messagebox
-from PIL import Image, ImageTk
+from tkinter import font as tkfont
 import os
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
 import configparser
 import shutil
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
+
+
+# Test record filename: SpeakingTest_CLASS_STUDENTID_YYYY.MM.DD.HHMM.txt (or YY.MM.DD.HHMM)
+TEST_FILENAME_RE = re.compile(
+    r'^SpeakingTest_(?P<cls>[^_]+)_(?P<sid>[^_]+)_'
+    r'(?P<y>\d{2,4})\.(?P<mo>\d{2})\.(?P<d>\d{2})\.(?P<t>\d+)\.txt$'
+)
+
+# Answer line in a test record: "Question 00: 5 = 1 0 0 0 0 filename" -> question number, points
+QUESTION_LINE_RE = re.compile(r'Question\s*([+-]?\d+)\s*:\s*([+-]?\d+)\s*=')
+
+# Folder name cleanup: characters to drop, and runs of whitespace to collapse
+FOLDER_INVALID_CHARS_RE = re.compile(r'[^\w\s-]')
+WHITESPACE_RUN_RE = re.compile(r'\s+')
+
+# Image file extensions that can be shown as slides or special images
+# (a tuple, so one str.endswith call checks them all)
+SUPPORTED_IMAGE_FORMATS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif')
+
+# Filename prefixes of the special images shown around a test (looked up in the script folder)
+SPECIAL_IMAGE_PREFIXES = ("Start_", "PreScore_", "PostScore_")
+
+# Shared widget options for the settings screens
+SETTINGS_ROW_FONT = ("Arial", 14)
+SETTINGS_ROW_PACK = {'side': tk.LEFT, 'padx': 5}
+COLOR_LABEL_OPTS = {'font': ("Arial", 11), 'bg': "white"}
+COLOR_LABEL_GRID = {'sticky': "e", 'padx': 5}
+COLOR_ENTRY_OPTS = {'font': ("Arial", 11), 'width': 10}
+HINT_LABEL_OPTS = {'font': ("Arial", 9), 'bg': "white", 'fg': "gray"}
+
+# Most decoded slides kept in memory at once (least recently shown are dropped first)
+IMAGE_CACHE_SIZE = 8
+
+# Big downscales first shrink by a whole factor with Image.reduce (a cheap box filter),
+# leaving LANCZOS at least this much scaling to do, so the result looks the same
+LANCZOS_REDUCING_GAP = 2.0
+
+# Slides after the current one that are decoded and scaled ahead of time on the worker thread
+PREWARM_SLIDES = 2
+
+# Fonts for the text drawn over the slides
+BUTTON_FONT = ("Arial", 12)             # Last clicked button and its points
+CLOCK_FONT = ("Arial", 24)              # Elapsed time clock and countdown timer
+UNSCORED_FONT = ("Arial", 28, "bold")   # "UNSCORED" banner
+
+# Root window sequences cleared on every screen change (see clear_screen)
+SCREEN_UNBIND_SEQUENCES = ("<Configure>", "<Return>", "<Key>")
+
+# Delay (ms) after the last resize event before redrawing, so a drag gets one redraw
+RESIZE_DEBOUNCE_MS = 200
+
+# PIL is imported on first use (see load_pil) so the first screen appears sooner
+Image = None
+ImageTk = None
+
+
+def load_pil():
+    """Import PIL's Image and ImageTk modules the first time an image is needed"""
+    global Image, ImageTk
+    if Image is None:
+        from PIL import Image as pil_image, ImageTk as pil_imagetk
+        Image, ImageTk = pil_image, pil_imagetk
+
+
+def fit_size(image_size, box_size):
+    """Largest (width, height) with image_size's aspect ratio that fits in box_size"""
+    img_width, img_height = image_size
+    scale = min(box_size[0] / img_width, box_size[1] / img_height)  # Allow upscaling
+    return int(img_width * scale), int(img_height * scale)
+
+
+def resize_lanczos(image, size):
+    """LANCZOS resize of image to size, box-reducing large downscales first"""
+    return image.resize(size, Image.Resampling.LANCZOS, reducing_gap=LANCZOS_REDUCING_GAP)
+
+
+def decode_image(image_path, target_size, bound):
+    """
+    Decode image_path, shrunk to fit within bound.
+    A JPEG larger than target_size (already clipped to bound) is decoded at a
+    reduced 1/2, 1/4 or 1/8 scale (draft mode) instead of at full resolution.
+    Returns: (image, full_size)
+    """
+    image = Image.open(image_path)
+    full_size = image.size
+    if target_size and image.format == 'JPEG':
+        # Let the JPEG decoder skip detail that would be scaled away anyway
+        image.draft(image.mode, target_size)
+    image.load()  # Decode now so the file is read (and closed) only once
+    image.thumbnail(bound, Image.Resampling.LANCZOS)
+    return image, full_size
+
+
+def prescale_image(image_path, canvas_size, bound):
+    """
+    Decode image_path and scale it to fit canvas_size, as display_current_image
+    would. Runs on the worker thread (PIL releases the GIL while decoding and
+    resizing), so it touches no app state.
+    """
+    target_size = (min(canvas_size[0], bound[0]), min(canvas_size[1], bound[1]))
+    image, _ = decode_image(image_path, target_size, bound)
+    return resize_lanczos(image, fit_size(image.size, canvas_size))
 
 
 class SpeakingTestApp:
@@ -40,24 +147,97 @@ class SpeakingTestApp:
         self.selected_slides_subfolder = None  # Track which subfolder is selected
         self.records_folder = os.path.join(script_dir, "Records")
         self.config_file = os.path.join(script_dir, "mouse_config.ini")
+        self._config = None  # Parsed config file, read once (see get_config)
         
         # Mouse button mapping (will be loaded from config or calibrated)
         # Format: {tkinter_button_event: position_number}
         self.mouse_button_map = {}
         
+        # Scoring, timer and general settings (defaults until loaded from config)
+        self.point_values = {position: 0 for position in range(1, 6)}
+        self.point_names = {position: "" for position in range(1, 6)}
+        self._point_scale_block = None  # Header lines built from these (see get_point_scale_block)
+        self.timer_seconds = 0
+        self.timer_start_text_color = '#000000'  # Black
+        self.timer_start_bg_color = '#D3D3D3'    # Light grey
+        self.timer_end_text_color = '#00FF00'    # Green
+        self.timer_end_bg_color = '#D3D3D3'      # Light grey
+        self.use_roster = False
+        self.reverse_count = False
+        
+        # Class roster kept in memory (see refresh_roster): the (path, mtime_ns) it
+        # was read from, its lines, and names indexed by normalized student ID
+        self._roster_stamp = (None, None)
+        self.set_roster_lines([])
+        
         # Calibration state
         self.calibration_step = 0
         self.calibration_mapping = {}
+        self._assigned_buttons = set()
+        
+        # Overlay text measuring: {font: (tkfont.Font, {char: width in pixels})}
+        self._font_metrics = {}
+        
+        # Test screen state shown in the overlays (set for real once a test starts)
+        self.last_clicked_button = None
+        self.unscored_images = set()
+        self.elapsed_seconds = None
+        self.current_timer_value = None
+        
+        # Decoded images keyed by path (most recently used last), so each slide
+        # is read from disk once while it stays among the last IMAGE_CACHE_SIZE shown
+        self._image_cache = {}
+        
+        # Decoded special images (Start/PreScore/PostScore) keyed by path, kept out
+        # of the slide cache so a long deck never evicts them
+        self._special_image_cache = {}
+        
+        # Cached images never keep more pixels than this (twice the screen size)
+        self._image_bound = (root.winfo_screenwidth() * 2, root.winfo_screenheight() * 2)
+        
+        # (path, width, height) of the slide currently held in self.photo,
+        # and the (size, mode) self.photo was created with
+        self._photo_key = None
+        self._photo_shape = None
+        
+        # Special image filenames found for this test: {prefix: filename}
+        self._special_images = {}
+        
+        # Rendered special images (Start/PreScore/PostScore): {path: ((canvas width, height), photo)}
+        self._special_photos = {}
+        
+        # Worker thread for LANCZOS resizes after a window resize, so Tk stays responsive
+        self._resize_pool = ThreadPoolExecutor(max_workers=1)
+        
+        # Upcoming slides being scaled on the worker thread: {(path, width, height): future}
+        self._prewarm_futures = {}
+        
+        # Output file kept open for appending answers while a test runs (see save_record)
+        self._output_handle = None
+        
+        # Class summary lines not yet written: [(summary_file, line), ...]
+        # (written together when returning to class entry, and on exit)
+        self._class_summary_buffer = []
+        atexit.register(self.flush_class_summary)
+        
+        # Settings screens whose widgets are built once and reused: {screen_name: frame}
+        self._kept_screens = {}
         
         # State management
         self.current_screen = "class"
         
+        # Root window bindings made by the current screen: [(sequence, funcid), ...]
+        self._screen_bindings = []
+        
         # Ensure required folders exist
         self.ensure_required_folders()
         
         # Check for and handle duplicates BEFORE starting
         self.check_and_handle_duplicates()
         
+        # Keyboard controls for the test screen
+        self.bind_test_keys()
+        
         # Load or create mouse button configuration
         if self.load_mouse_config():
             # Config loaded successfully, start with class entry
@@ -71,8 +251,15 @@ class SpeakingTestApp:
     def check_and_handle_duplicates(self):
         """Check for duplicate test files and move them to Duplicates folder"""
         try:
+            # Skip the scan if no class folder has changed since the last one
+            if self.get_records_stamp() == self.load_duplicate_check_stamp():
+                return
+            
             duplicates_moved = self.find_and_move_duplicates()
             
+            # Remember the state after moving, so the next launch can skip the scan
+            self.save_duplicate_check_stamp(self.get_records_stamp())
+            
             # Only show message if duplicates were found
             if duplicates_moved > 0:
                 messagebox.showinfo(
@@ -87,90 +274,121 @@ class SpeakingTestApp:
             # Don't stop the app if duplicate checking fails
             print(f"Error checking duplicates: {e}")
     
+    def get_records_stamp(self):
+        """
+        Get the latest modification time (ns) of the Records folder and its class folders.
+        Adding, renaming or removing a test file changes its class folder's mtime.
+        """
+        stamp = os.stat(self.records_folder).st_mtime_ns
+        with os.scandir(self.records_folder) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stamp = max(stamp, entry.stat(follow_symlinks=False).st_mtime_ns)
+        return stamp
+    
+    def load_duplicate_check_stamp(self):
+        """Load the Records stamp saved after the last duplicate scan. Returns None if not saved."""
+        try:
+            return self.get_config().getint('DuplicateCheck', 'last_mtime_ns', fallback=None)
+        except (configparser.Error, ValueError):
+            return None
+    
+    def save_duplicate_check_stamp(self, stamp):
+        """Save the Records stamp to the INI file (only if it already exists)"""
+        # Don't create the config file here - a missing file means calibration is needed
+        if not os.path.exists(self.config_file):
+            return
+        
+        try:
+            self.get_config()
+            if self.update_config_section('DuplicateCheck', {'last_mtime_ns': str(stamp)}):
+                with open(self.config_file, 'w') as f:
+                    self._config.write(f)
+        except configparser.Error:
+            # Corrupted config is handled by load_mouse_config
+            pass
+    
     def find_and_move_duplicates(self):
         """Find duplicate test files and move older ones to Duplicates folder. Returns count moved."""
-        from collections import defaultdict
+        # Shared with the standalone scripts; imported here since most launches skip the scan
+        from find_duplicates import move_file, unique_dest_name
         
         duplicates_folder = os.path.join(self.records_folder, "Duplicates")
         Path(duplicates_folder).mkdir(parents=True, exist_ok=True)
         
+        # Destination prefix built once instead of an os.path.join per move
+        duplicates_prefix = duplicates_folder + os.sep
+        
+        # Names already in Duplicates, so name conflicts are resolved without a stat per try
+        with os.scandir(duplicates_folder) as it:
+            existing_names = {entry.name for entry in it}
+        
         total_moved = 0
         
-        # Process each class folder
-        for item in os.listdir(self.records_folder):
-            item_path = os.path.join(self.records_folder, item)
-            
-            # Skip Duplicates folder itself and non-directories
-            if item == "Duplicates" or not os.path.isdir(item_path):
-                continue
+        # Process each class folder (scandir avoids a stat call per entry)
+        with os.scandir(self.records_folder) as it:
+            class_dirs = [entry.path for entry in it
+                          if entry.name != "Duplicates" and entry.is_dir(follow_symlinks=False)]
+        
+        for item_path in class_dirs:
+            # Parsed test files as (class, normalized_student_id, datetime, filepath, filename)
+            records = []
             
-            # Group files by (class, normalized_student_id)
-            student_files = defaultdict(list)
+            with os.scandir(item_path) as it:
+                file_entries = list(it)
             
-            for filename in os.listdir(item_path):
-                filepath = os.path.join(item_path, filename)
+            for inner in file_entries:
+                filename = inner.name
+                filepath = inner.path
                 
-                # Skip non-files and processed files
-                if not os.path.isfile(filepath) or '_PROCESSED.txt' in filename:
+                # Skip processed files (cheap suffix check first) and non-files
+                if filename.endswith('_PROCESSED.txt') or not inner.is_file(follow_symlinks=False):
                     continue
                 
                 # Parse filename: SpeakingTest_CLASS_STUDENTID_TIMESTAMP.txt
-                if filename.startswith('SpeakingTest_') and filename.endswith('.txt'):
-                    parts = filename.replace('.txt', '').split('_')
-                    if len(parts) >= 4:
-                        class_number = parts[1]
-                        student_id = parts[2]
-                        timestamp = parts[3]
-                        
-                        # Normalize student ID (1 == 01)
-                        normalized_id = str(int(student_id)) if student_id.isdigit() else student_id
-                        
-                        # Parse timestamp for sorting
-                        try:
-                            ts_parts = timestamp.split('.')
-                            if len(ts_parts) == 4:
-                                year, month, day, time = ts_parts
-                                if len(year) == 2:
-                                    year = '20' + year
-                                hour = time[:2] if len(time) >= 2 else '00'
-                                minute = time[2:4] if len(time) >= 4 else '00'
-                                dt = datetime(int(year), int(month), int(day), int(hour), int(minute))
-                            else:
-                                dt = datetime(1900, 1, 1)
-                        except:
-                            dt = datetime(1900, 1, 1)
-                        
-                        key = (class_number, normalized_id)
-                        student_files[key].append({
-                            'filepath': filepath,
-                            'filename': filename,
-                            'datetime': dt
-                        })
+                match = TEST_FILENAME_RE.match(filename)
+                if not match:
+                    continue
+                
+                class_number = match.group('cls')
+                student_id = match.group('sid')
+                
+                # Normalize student ID (1 == 01)
+                normalized_id = (student_id.lstrip('0') or '0') if student_id.isdigit() else student_id
+                
+                # Parse timestamp for sorting - the regex already guarantees the shape
+                year = match.group('y')
+                if len(year) == 2:
+                    year = '20' + year
+                timestamp = f"{year}.{match.group('mo')}.{match.group('d')}.{match.group('t')[:4]}"
+                try:
+                    dt = datetime.strptime(timestamp, "%Y.%m.%d.%H%M")
+                except ValueError:
+                    # Date/time values out of range
+                    dt = datetime(1900, 1, 1)
+                
+                records.append((class_number, normalized_id, dt, filepath, filename))
+            
+            # Sort by (class, student, datetime) so each student's files are adjacent, oldest first
+            records.sort(key=itemgetter(0, 1, 2))
             
             # Find and move duplicates
-            for key, files in student_files.items():
-                if len(files) > 1:
-                    # Sort by datetime (oldest first)
-                    files.sort(key=lambda x: x['datetime'])
+            for key, group in groupby(records, key=itemgetter(0, 1)):
+                files = list(group)
+                if len(files) < 2:
+                    continue
+                
+                # Move all but the newest
+                for _, _, _, filepath, filename in files[:-1]:  # All except last (newest)
+                    # Handle name conflicts
+                    dest_path = duplicates_prefix + unique_dest_name(filename, existing_names)
                     
-                    # Move all but the newest
-                    for file_info in files[:-1]:  # All except last (newest)
-                        dest_path = os.path.join(duplicates_folder, file_info['filename'])
-                        
-                        # Handle name conflicts
-                        if os.path.exists(dest_path):
-                            base, ext = os.path.splitext(file_info['filename'])
-                            counter = 1
-                            while os.path.exists(dest_path):
-                                dest_path = os.path.join(duplicates_folder, f"{base}_dup{counter}{ext}")
-                                counter += 1
-                        
-                        # Move the file
-                        try:
-                            shutil.move(file_info['filepath'], dest_path)
-                            total_moved += 1
-                        except:
-                            pass
+                    # Move the file (a single rename, unless it has to cross drives)
+                    try:
+                        move_file(filepath, dest_path)
+                        total_moved += 1
+                    except:
+                        pass
         
         return total_moved
     
@@ -186,6 +404,7 @@ class SpeakingTestApp:
                 icon='warning'
             )
             if result:
+                self.close_output_file()
                 self.root.destroy()
         else:
             # Not during a test - just confirm
@@ -207,14 +426,65 @@ class SpeakingTestApp:
         """Bind ESC key globally"""
         self.root.bind("<Escape>", self.handle_escape)
     
+    def bind_screen(self, sequence, func):
+        """
+        Bind func to sequence on the root window for the current screen only.
+        clear_screen removes it again, along with its Tcl command.
+        """
+        funcid = self.root.bind(sequence, func)
+        self._screen_bindings.append((sequence, funcid))
+    
+    def bind_test_keys(self):
+        """
+        Bind the test's keyboard keys globally, once. They only act while the
+        image screen is showing, so typing in other screens' entries is unaffected.
+        """
+        def on_image_screen(action):
+            return lambda e: action(e) if self.current_screen == "image" else None
+        
+        self.root.bind("<BackSpace>", on_image_screen(self.handle_backspace))
+        self.root.bind("<Up>", on_image_screen(lambda e: self.go_previous()))  # Up arrow - go back
+        self.root.bind("<Down>", on_image_screen(lambda e: self.go_next()))  # Down arrow - go forward
+        
+        # Bind number keys 1-5 to function like mouse positions 1-5
+        for position in range(1, 6):
+            self.root.bind(str(position), on_image_screen(lambda e, pos=position: self.handle_click(pos)))
+        
+        # Bind Tab to jump to student ID input
+        self.root.bind("<Tab>", on_image_screen(lambda e: self.show_student_entry()))
+        # Bind Shift+Tab to jump to class input
+        self.root.bind("<Shift-Tab>", on_image_screen(lambda e: self.show_class_entry()))
+    
+    def entry_submit_handler(self, submit):
+        """
+        Handler for Enter/Tab in an entry: run submit and stop the event there.
+        Without the "break" the root's Tab binding would also fire once submit
+        has switched to the image screen, sending the test straight back.
+        """
+        def handler(e):
+            submit()
+            return "break"
+        return handler
+    
+    def get_config(self):
+        """
+        Return the parsed config file, reading it on first use.
+        Every load and save goes through this one ConfigParser, so the file is
+        read once per run and only written by the save methods.
+        """
+        if self._config is None:
+            config = configparser.ConfigParser()
+            config.read(self.config_file)
+            self._config = config
+        return self._config
+    
     def load_mouse_config(self):
         """Load mouse button configuration from INI file. Returns True if successful."""
         if not os.path.exists(self.config_file):
             return False
         
         try:
-            config = configparser.ConfigParser()
-            config.read(self.config_file)
+            config = self.get_config()
             
             # Check if the config has the required section and keys
             if 'MouseButtons' not in config:
@@ -231,6 +501,7 @@ class SpeakingTestApp:
                 self.mouse_button_map[button_event] = int(pos)
             
             # Load point values if they exist
+            self._point_scale_block = None
             self.point_values = {}
             if 'PointValues' in config:
                 for pos in required_positions:
@@ -288,6 +559,8 @@ class SpeakingTestApp:
             
         except Exception as e:
             # If there's any error, backup the corrupted file and recalibrate
+            # (saving then starts from a fresh config)
+            self._config = None
             if os.path.exists(self.config_file):
                 backup_name = f"{self.config_file}.backup"
                 shutil.copy(self.config_file, backup_name)
@@ -295,43 +568,65 @@ class SpeakingTestApp:
     
     def save_mouse_config(self):
         """Save mouse button configuration to INI file"""
-        config = configparser.ConfigParser()
-        config['MouseButtons'] = {}
+        # Reuse the config parsed at load time, only updating values that changed
+        if self._config is None:
+            self._config = configparser.ConfigParser()
+        
+        changed = False
         
         # Save the mapping (position: button_event)
-        for button_event, position in self.mouse_button_map.items():
-            config['MouseButtons'][str(position)] = button_event
+        changed |= self.update_config_section('MouseButtons', {
+            str(position): button_event for button_event, position in self.mouse_button_map.items()
+        })
         
         # Save point values
-        config['PointValues'] = {}
-        if hasattr(self, 'point_values'):
-            for position, points in self.point_values.items():
-                config['PointValues'][str(position)] = str(points)
+        changed |= self.update_config_section('PointValues', {
+            str(position): str(points) for position, points in self.point_values.items()
+        })
         
         # Save point names
-        config['PointNames'] = {}
-        if hasattr(self, 'point_names'):
-            for position, name in self.point_names.items():
-                config['PointNames'][str(position)] = name
+        changed |= self.update_config_section('PointNames', {
+            str(position): name for position, name in self.point_names.items()
+        })
         
         # Save timer settings
-        config['TimerSettings'] = {}
-        if hasattr(self, 'timer_seconds'):
-            config['TimerSettings']['seconds'] = str(self.timer_seconds)
-            config['TimerSettings']['start_text_color'] = self.timer_start_text_color
-            config['TimerSettings']['start_bg_color'] = self.timer_start_bg_color
-            config['TimerSettings']['end_text_color'] = self.timer_end_text_color
-            config['TimerSettings']['end_bg_color'] = self.timer_end_bg_color
+        changed |= self.update_config_section('TimerSettings', {
+            'seconds': str(self.timer_seconds),
+            'start_text_color': self.timer_start_text_color,
+            'start_bg_color': self.timer_start_bg_color,
+            'end_text_color': self.timer_end_text_color,
+            'end_bg_color': self.timer_end_bg_color,
+        })
         
         # Save general settings
-        config['GeneralSettings'] = {}
-        if hasattr(self, 'use_roster'):
-            config['GeneralSettings']['use_roster'] = str(self.use_roster)
-        if hasattr(self, 'reverse_count'):
-            config['GeneralSettings']['reverse_count'] = str(self.reverse_count)
+        changed |= self.update_config_section('GeneralSettings', {
+            'use_roster': str(self.use_roster),
+            'reverse_count': str(self.reverse_count),
+        })
+        
+        # Nothing new to save - skip rewriting the file
+        if not changed and os.path.exists(self.config_file):
+            return
         
         with open(self.config_file, 'w') as f:
-            config.write(f)
+            self._config.write(f)
+    
+    def update_config_section(self, section, values):
+        """
+        Update a section of the cached config in place, only touching changed keys.
+        Returns True if anything was added or changed.
+        """
+        changed = False
+        if not self._config.has_section(section):
+            self._config.add_section(section)
+            changed = True
+        
+        for key, value in values.items():
+            if self._config[section].get(key) != value:
+                self._config[section][key] = value
+                changed = True
+        
+        return changed
     
     def start_calibration(self):
         """Start the mouse button calibration process"""
@@ -339,6 +634,7 @@ class SpeakingTestApp:
         self.current_screen = "calibration"
         self.calibration_step = 1
         self.calibration_mapping = {}
+        self._assigned_buttons = set()  # event.num of buttons already used, for O(1) duplicate checks
         
         # Create frame
         frame = tk.Frame(self.root, bg="white")
@@ -373,17 +669,16 @@ class SpeakingTestApp:
     
     def handle_calibration_click(self, event):
         """Handle mouse clicks during calibration"""
-        button_event = f"Button-{event.num}"
-        
         # Check if this button was already assigned
-        if button_event in self.calibration_mapping.values():
+        if event.num in self._assigned_buttons:
             messagebox.showwarning("Duplicate Button", 
                                  f"You already assigned this button to another position.\n"
                                  f"Please use a different mouse button.")
             return
         
         # Record the mapping
-        self.calibration_mapping[self.calibration_step] = button_event
+        self.calibration_mapping[self.calibration_step] = f"Button-{event.num}"
+        self._assigned_buttons.add(event.num)
         
         # Move to next step
         self.calibration_step += 1
@@ -410,6 +705,7 @@ class SpeakingTestApp:
         self.mouse_button_map = {}
         for position, button_event in self.calibration_mapping.items():
             self.mouse_button_map[button_event] = position
+        self._assigned_buttons.clear()
         
         # Now ask for point values
         self.show_point_value_configuration()
@@ -419,9 +715,19 @@ class SpeakingTestApp:
         self.clear_screen()
         self.current_screen = "point_config"
         
+        # Widgets are built on first show and kept for later visits
+        main_frame = self._kept_screens.get("point_config")
+        if main_frame is None:
+            main_frame = self.build_point_config_screen()
+            self._kept_screens["point_config"] = main_frame
+        
+        self.populate_point_config_screen()
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=40, pady=40)
+    
+    def build_point_config_screen(self):
+        """Create the point value configuration widgets once and return their frame"""
         # Create scrollable frame
         main_frame = tk.Frame(self.root, bg="white")
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=40, pady=40)
         
         # Title
         title = tk.Label(main_frame, text="Configure Point Values and Names", 
@@ -448,27 +754,23 @@ class SpeakingTestApp:
             # Label showing which mouse button this is
             label = tk.Label(row_frame, text=f"Mouse Button {position}:", 
                            font=("Arial", 14, "bold"), bg="white", width=18, anchor="e")
-            label.pack(side=tk.LEFT, padx=5)
+            label.pack(**SETTINGS_ROW_PACK)
             
-            # Point value entry - pre-fill with existing value
-            point_entry = tk.Entry(row_frame, font=("Arial", 14), width=8)
-            existing_points = self.point_values.get(position, 0) if hasattr(self, 'point_values') else 0
-            point_entry.insert(0, str(existing_points))
-            point_entry.pack(side=tk.LEFT, padx=5)
+            # Point value entry (filled in by populate_point_config_screen)
+            point_entry = tk.Entry(row_frame, font=SETTINGS_ROW_FONT, width=8)
+            point_entry.pack(**SETTINGS_ROW_PACK)
             
             points_label = tk.Label(row_frame, text="points", 
-                                   font=("Arial", 14), bg="white", width=6, anchor="w")
-            points_label.pack(side=tk.LEFT, padx=5)
+                                   font=SETTINGS_ROW_FONT, bg="white", width=6, anchor="w")
+            points_label.pack(**SETTINGS_ROW_PACK)
             
-            # Name entry - pre-fill with existing name
-            name_entry = tk.Entry(row_frame, font=("Arial", 14), width=20)
-            existing_name = self.point_names.get(position, "") if hasattr(self, 'point_names') else ""
-            name_entry.insert(0, existing_name)
-            name_entry.pack(side=tk.LEFT, padx=5)
+            # Name entry (filled in by populate_point_config_screen)
+            name_entry = tk.Entry(row_frame, font=SETTINGS_ROW_FONT, width=20)
+            name_entry.pack(**SETTINGS_ROW_PACK)
             
             name_label = tk.Label(row_frame, text="name", 
-                                 font=("Arial", 14), bg="white", width=5, anchor="w")
-            name_label.pack(side=tk.LEFT, padx=5)
+                                 font=SETTINGS_ROW_FONT, bg="white", width=5, anchor="w")
+            name_label.pack(**SETTINGS_ROW_PACK)
             
             self.point_entries[position] = point_entry
             self.name_entries[position] = name_entry
@@ -483,6 +785,21 @@ class SpeakingTestApp:
         btn = tk.Button(main_frame, text="Save Configuration", font=("Arial", 16), 
                        command=self.save_point_values_and_names, width=20, bg="lightblue")
         btn.pack(pady=20)
+        
+        return main_frame
+    
+    def populate_point_config_screen(self):
+        """Pre-fill the point value and name entries with the current settings"""
+        for position in range(1, 6):
+            point_entry = self.point_entries[position]
+            existing_points = self.point_values.get(position, 0)
+            point_entry.delete(0, tk.END)
+            point_entry.insert(0, str(existing_points))
+            
+            name_entry = self.name_entries[position]
+            existing_name = self.point_names.get(position, "")
+            name_entry.delete(0, tk.END)
+            name_entry.insert(0, existing_name)
     
     def save_point_values_and_names(self):
         """Save the point values and names and complete setup"""
@@ -502,6 +819,7 @@ class SpeakingTestApp:
             # Get name
             name = self.name_entries[position].get().strip()
             self.point_names[position] = name if name else ""
+        self._point_scale_block = None
         
         # Save everything to INI file
         self.save_mouse_config()
@@ -519,9 +837,19 @@ class SpeakingTestApp:
         self.clear_screen()
         self.current_screen = "timer_settings"
         
+        # Widgets are built on first show and kept for later visits
+        main_frame = self._kept_screens.get("timer_settings")
+        if main_frame is None:
+            main_frame = self.build_timer_settings_screen()
+            self._kept_screens["timer_settings"] = main_frame
+        
+        self.populate_timer_settings_screen()
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=40, pady=40)
+    
+    def build_timer_settings_screen(self):
+        """Create the timer settings widgets once and return their frame"""
         # Create main frame
         main_frame = tk.Frame(self.root, bg="white")
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=40, pady=40)
         
         # Title
         title = tk.Label(main_frame, text="Timer Settings", 
@@ -533,13 +861,11 @@ class SpeakingTestApp:
         seconds_frame.pack(pady=15)
         
         seconds_label = tk.Label(seconds_frame, text="Countdown Seconds:", 
-                                font=("Arial", 14), bg="white", width=20, anchor="e")
-        seconds_label.pack(side=tk.LEFT, padx=5)
+                                font=SETTINGS_ROW_FONT, bg="white", width=20, anchor="e")
+        seconds_label.pack(**SETTINGS_ROW_PACK)
         
-        self.timer_seconds_entry = tk.Entry(seconds_frame, font=("Arial", 14), width=10)
-        current_seconds = self.timer_seconds if hasattr(self, 'timer_seconds') else 0
-        self.timer_seconds_entry.insert(0, str(current_seconds))
-        self.timer_seconds_entry.pack(side=tk.LEFT, padx=5)
+        self.timer_seconds_entry = tk.Entry(seconds_frame, font=SETTINGS_ROW_FONT, width=10)
+        self.timer_seconds_entry.pack(**SETTINGS_ROW_PACK)
         
         # Validate that it's a number
         def validate_number(event):
@@ -553,7 +879,7 @@ class SpeakingTestApp:
         
         info_label = tk.Label(seconds_frame, text="(0 = no timer)", 
                              font=("Arial", 10), bg="white", fg="gray")
-        info_label.pack(side=tk.LEFT, padx=5)
+        info_label.pack(**SETTINGS_ROW_PACK)
         
         # Color settings
         colors_frame = tk.Frame(main_frame, bg="white")
@@ -564,38 +890,30 @@ class SpeakingTestApp:
                               font=("Arial", 12, "bold"), bg="white")
         start_label.grid(row=0, column=0, columnspan=3, pady=5, sticky="w")
         
-        tk.Label(colors_frame, text="Text Color:", font=("Arial", 11), bg="white").grid(row=1, column=0, sticky="e", padx=5)
-        self.timer_start_text_entry = tk.Entry(colors_frame, font=("Arial", 11), width=10)
-        start_text = self.timer_start_text_color if hasattr(self, 'timer_start_text_color') else '#000000'
-        self.timer_start_text_entry.insert(0, start_text)
+        tk.Label(colors_frame, text="Text Color:", **COLOR_LABEL_OPTS).grid(row=1, column=0, **COLOR_LABEL_GRID)
+        self.timer_start_text_entry = tk.Entry(colors_frame, **COLOR_ENTRY_OPTS)
         self.timer_start_text_entry.grid(row=1, column=1, padx=5)
-        tk.Label(colors_frame, text="(e.g., #000000 = black)", font=("Arial", 9), bg="white", fg="gray").grid(row=1, column=2, sticky="w")
+        tk.Label(colors_frame, text="(e.g., #000000 = black)", **HINT_LABEL_OPTS).grid(row=1, column=2, sticky="w")
         
-        tk.Label(colors_frame, text="Background:", font=("Arial", 11), bg="white").grid(row=2, column=0, sticky="e", padx=5)
-        self.timer_start_bg_entry = tk.Entry(colors_frame, font=("Arial", 11), width=10)
-        start_bg = self.timer_start_bg_color if hasattr(self, 'timer_start_bg_color') else '#D3D3D3'
-        self.timer_start_bg_entry.insert(0, start_bg)
+        tk.Label(colors_frame, text="Background:", **COLOR_LABEL_OPTS).grid(row=2, column=0, **COLOR_LABEL_GRID)
+        self.timer_start_bg_entry = tk.Entry(colors_frame, **COLOR_ENTRY_OPTS)
         self.timer_start_bg_entry.grid(row=2, column=1, padx=5)
-        tk.Label(colors_frame, text="(e.g., #D3D3D3 = light grey)", font=("Arial", 9), bg="white", fg="gray").grid(row=2, column=2, sticky="w")
+        tk.Label(colors_frame, text="(e.g., #D3D3D3 = light grey)", **HINT_LABEL_OPTS).grid(row=2, column=2, sticky="w")
         
         # End colors (at zero)
         end_label = tk.Label(colors_frame, text="End Colors (at zero):", 
                             font=("Arial", 12, "bold"), bg="white")
         end_label.grid(row=3, column=0, columnspan=3, pady=(15,5), sticky="w")
         
-        tk.Label(colors_frame, text="Text Color:", font=("Arial", 11), bg="white").grid(row=4, column=0, sticky="e", padx=5)
-        self.timer_end_text_entry = tk.Entry(colors_frame, font=("Arial", 11), width=10)
-        end_text = self.timer_end_text_color if hasattr(self, 'timer_end_text_color') else '#00FF00'
-        self.timer_end_text_entry.insert(0, end_text)
+        tk.Label(colors_frame, text="Text Color:", **COLOR_LABEL_OPTS).grid(row=4, column=0, **COLOR_LABEL_GRID)
+        self.timer_end_text_entry = tk.Entry(colors_frame, **COLOR_ENTRY_OPTS)
         self.timer_end_text_entry.grid(row=4, column=1, padx=5)
-        tk.Label(colors_frame, text="(e.g., #00FF00 = green)", font=("Arial", 9), bg="white", fg="gray").grid(row=4, column=2, sticky="w")
+        tk.Label(colors_frame, text="(e.g., #00FF00 = green)", **HINT_LABEL_OPTS).grid(row=4, column=2, sticky="w")
         
-        tk.Label(colors_frame, text="Background:", font=("Arial", 11), bg="white").grid(row=5, column=0, sticky="e", padx=5)
-        self.timer_end_bg_entry = tk.Entry(colors_frame, font=("Arial", 11), width=10)
-        end_bg = self.timer_end_bg_color if hasattr(self, 'timer_end_bg_color') else '#D3D3D3'
-        self.timer_end_bg_entry.insert(0, end_bg)
+        tk.Label(colors_frame, text="Background:", **COLOR_LABEL_OPTS).grid(row=5, column=0, **COLOR_LABEL_GRID)
+        self.timer_end_bg_entry = tk.Entry(colors_frame, **COLOR_ENTRY_OPTS)
         self.timer_end_bg_entry.grid(row=5, column=1, padx=5)
-        tk.Label(colors_frame, text="(e.g., #D3D3D3 = light grey)", font=("Arial", 9), bg="white", fg="gray").grid(row=5, column=2, sticky="w")
+        tk.Label(colors_frame, text="(e.g., #D3D3D3 = light grey)", **HINT_LABEL_OPTS).grid(row=5, column=2, sticky="w")
         
         # Save and Cancel buttons
         button_frame = tk.Frame(main_frame, bg="white")
@@ -608,6 +926,18 @@ class SpeakingTestApp:
         cancel_btn = tk.Button(button_frame, text="Cancel", font=("Arial", 14), 
                               command=self.show_class_entry, width=12)
         cancel_btn.pack(side=tk.LEFT, padx=10)
+        
+        return main_frame
+    
+    def populate_timer_settings_screen(self):
+        """Pre-fill the timer entries with the current settings"""
+        for entry, value in ((self.timer_seconds_entry, str(self.timer_seconds)),
+                             (self.timer_start_text_entry, self.timer_start_text_color),
+                             (self.timer_start_bg_entry, self.timer_start_bg_color),
+                             (self.timer_end_text_entry, self.timer_end_text_color),
+                             (self.timer_end_bg_entry, self.timer_end_bg_color)):
+            entry.delete(0, tk.END)
+            entry.insert(0, value)
     
     def save_timer_settings(self):
         """Save timer settings to config"""
@@ -632,19 +962,63 @@ class SpeakingTestApp:
         
         self.show_class_entry()
     
-    def find_special_image(self, prefix):
-        """Find a special image file with given prefix (Start_, PreScore_, PostScore_) in root directory"""
-        supported_formats = ['.png', '.jpg', '.jpeg', '.bmp', '.gif']
+    def scan_special_images(self):
+        """
+        Find the special image for each of SPECIAL_IMAGE_PREFIXES in one pass over
+        the root directory. Done once per test, so find_special_image is a lookup.
+        """
+        self._special_images = {}
+        prefixes = [(prefix, prefix.lower()) for prefix in SPECIAL_IMAGE_PREFIXES]
         
         # Look in the current directory (where the script is)
-        for file in os.listdir('.'):
-            if os.path.isfile(file):
-                filename_lower = file.lower()
-                if filename_lower.startswith(prefix.lower()):
-                    _, ext = os.path.splitext(file)
-                    if ext.lower() in supported_formats:
-                        return file
-        return None
+        with os.scandir('.') as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    filename_lower = entry.name.lower()
+                    if not filename_lower.endswith(SUPPORTED_IMAGE_FORMATS):
+                        continue
+                    for prefix, prefix_lower in prefixes:
+                        # First match for each prefix wins
+                        if filename_lower.startswith(prefix_lower):
+                            self._special_images.setdefault(prefix, entry.name)
+    
+    def find_special_image(self, prefix):
+        """Find a special image file with given prefix (Start_, PreScore_, PostScore_) in root directory"""
+        return self._special_images.get(prefix)
+    
+    def get_cached_image(self, image_path, target_size=None, special=False):
+        """
+        Return the decoded PIL image for image_path, loading it on first use.
+        JPEGs larger than target_size are decoded at a reduced scale (draft mode),
+        and decoded again later if a bigger target needs more detail. Sources
+        bigger than self._image_bound are shrunk to it once, so later resizes
+        work on fewer pixels.
+        special=True keeps the image in the uncapped special image cache.
+        """
+        load_pil()
+        
+        bound = self._image_bound
+        if target_size is not None:
+            target_size = (min(target_size[0], bound[0]), min(target_size[1], bound[1]))
+        
+        cache = self._special_image_cache if special else self._image_cache
+        cached = cache.pop(image_path, None)
+        if cached is not None:
+            # Re-insert to mark it as the most recently used
+            cache[image_path] = cached
+            image, full_size = cached
+            # Enough detail as long as fitting it to the target scales it down
+            if (target_size is None or image.size == full_size
+                    or image.size[0] >= target_size[0] or image.size[1] >= target_size[1]):
+                return image
+        
+        image, full_size = decode_image(image_path, target_size, bound)
+        cache[image_path] = (image, full_size)
+        
+        # Drop the least recently used slides to cap memory
+        while not special and len(self._image_cache) > IMAGE_CACHE_SIZE:
+            del self._image_cache[next(iter(self._image_cache))]
+        return image
     
     def show_special_image_screen(self, image_path, next_action):
         """Display a special image (Start, PreScore, PostScore) and wait for click"""
@@ -659,32 +1033,50 @@ class SpeakingTestApp:
         self.special_canvas = tk.Canvas(self.root, bg="black", highlightthickness=0)
         self.special_canvas.pack(fill=tk.BOTH, expand=True)
         
-        # Bind window resize event
-        self.root.bind("<Configure>", self.on_special_image_resize)
+        # Bind resize on the canvas only; binding on root would also fire for
+        # every child widget's geometry change
+        self.special_canvas.bind("<Configure>", self.on_special_image_resize)
         
         # Display the image
         self.display_special_image()
         
         # Bind click to continue
         self.special_canvas.bind("<Button-1>", lambda e: next_action())
-        self.root.bind("<Return>", lambda e: next_action())
+        self.bind_screen("<Return>", lambda e: next_action())
         
         self.special_canvas.focus_set()
     
     def on_special_image_resize(self, event):
         """Handle window resize for special images"""
         if self.current_screen == "special_image" and hasattr(self, 'special_canvas'):
+            # Ignore events that don't change the size the image was drawn at
+            if (event.widget is not self.special_canvas
+                    or getattr(self, '_special_render_size', None) == (event.width, event.height)):
+                return
             try:
                 self.special_canvas.winfo_exists()
                 # Add a small delay to avoid excessive redraws during resize
                 if hasattr(self, '_special_resize_timer'):
                     self.root.after_cancel(self._special_resize_timer)
-                self._special_resize_timer = self.root.after(100, self.display_special_image)
+                if hasattr(self, '_special_finalize_timer'):
+                    self.root.after_cancel(self._special_finalize_timer)
+                # Drop any background resize still running for the old size
+                self._special_resize_future = None
+                # Quick BILINEAR redraw while resizing, then a LANCZOS pass once it settles
+                self._special_resize_timer = self.root.after(
+                    RESIZE_DEBOUNCE_MS, lambda: self.display_special_image(fast=True))
+                self._special_finalize_timer = self.root.after(
+                    RESIZE_DEBOUNCE_MS * 2, lambda: self.display_special_image(background=True))
             except tk.TclError:
                 pass
     
-    def display_special_image(self):
-        """Load and display the special image, scaled to window"""
+    def display_special_image(self, fast=False, background=False):
+        """
+        Load and display the special image, scaled to window.
+        fast=True uses a cheaper BILINEAR resize for redraws in the middle of a resize.
+        background=True runs the LANCZOS resize on the worker thread; the current
+        image stays up until finish_special_resize shows the result.
+        """
         if not hasattr(self, 'special_canvas') or not hasattr(self, 'special_image_path'):
             return
         
@@ -695,9 +1087,6 @@ class SpeakingTestApp:
             return
         
         try:
-            # Load image
-            image = Image.open(self.special_image_path)
-            
             # Update window to get accurate dimensions
             self.root.update_idletasks()
             
@@ -711,67 +1100,104 @@ class SpeakingTestApp:
             if canvas_height < 100:
                 canvas_height = self.root.winfo_height()
             
-            # Get image dimensions
-            img_width, img_height = image.size
+            # Nothing to redraw if the canvas size hasn't changed
+            if getattr(self, '_special_render_size', None) == (canvas_width, canvas_height):
+                return
             
-            # Calculate scaling factor to fit within canvas (allow upscaling)
-            if img_width > 0 and img_height > 0 and canvas_width > 0 and canvas_height > 0:
-                width_ratio = canvas_width / img_width
-                height_ratio = canvas_height / img_height
-                scale = min(width_ratio, height_ratio)  # Removed the 1.0 cap to allow upscaling
+            # Reuse the last render of this image if it was for the same canvas size
+            # (the same Start/PreScore/PostScore images are shown for every student),
+            # without going back to the decoder
+            canvas_size = (canvas_width, canvas_height)
+            cached = self._special_photos.get(self.special_image_path)
+            if cached is not None and cached[0] == canvas_size:
+                self.special_photo = cached[1]
+            else:
+                # Load image (decoded once, then reused)
+                image = self.get_cached_image(self.special_image_path, canvas_size, special=True)
                 
-                new_width = int(img_width * scale)
-                new_height = int(img_height * scale)
+                # Get image dimensions
+                img_width, img_height = image.size
+                new_size = None
                 
-                # Resize image
-                image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Convert to PhotoImage
-            self.special_photo = ImageTk.PhotoImage(image)
+                # Calculate scaling factor to fit within canvas (allow upscaling)
+                if img_width > 0 and img_height > 0 and canvas_width > 0 and canvas_height > 0:
+                    width_ratio = canvas_width / img_width
+                    height_ratio = canvas_height / img_height
+                    scale = min(width_ratio, height_ratio)  # Removed the 1.0 cap to allow upscaling
+                    
+                    new_size = (int(img_width * scale), int(img_height * scale))
+                
+                if fast:
+                    # Interim render - not cached, the LANCZOS pass replaces it
+                    if new_size is not None:
+                        image = image.resize(new_size, Image.Resampling.BILINEAR)
+                    self.special_photo = ImageTk.PhotoImage(image)
+                elif background and new_size is not None:
+                    # PIL releases the GIL while resizing; the PhotoImage is made back on the Tk thread
+                    future = self._resize_pool.submit(resize_lanczos, image, new_size)
+                    self._special_resize_future = future
+                    self.finish_special_resize(future, self.special_image_path, canvas_size)
+                    return
+                else:
+                    # Resize image
+                    if new_size is not None:
+                        image = resize_lanczos(image, new_size)
+                    
+                    # Convert to PhotoImage
+                    self.special_photo = ImageTk.PhotoImage(image)
+                    self._special_photos[self.special_image_path] = (canvas_size, self.special_photo)
             
             # Clear canvas and display image
             self.special_canvas.delete("all")
             self.special_canvas.create_image(canvas_width // 2, canvas_height // 2, 
                                            image=self.special_photo, anchor="center")
             
+            # Only a full quality render counts as done for this size
+            self._special_render_size = None if fast else (canvas_width, canvas_height)
+            
         except Exception as e:
             print(f"Error displaying special image: {e}")
     
-    def lookup_student_in_roster(self, student_id):
-        """Look up student name in roster. Returns name or None if not found."""
-        if not hasattr(self, 'roster_file') or not os.path.exists(self.roster_file):
-            return None
+    def finish_special_resize(self, future, image_path, canvas_size):
+        """Show a background resize once it's done (polled from the Tk thread)"""
+        if not future.done():
+            self._special_poll_timer = self.root.after(
+                15, lambda: self.finish_special_resize(future, image_path, canvas_size))
+            return
         
-        # Normalize student ID (remove leading zeros for comparison)
-        normalized_id = str(int(student_id)) if student_id.isdigit() else student_id
+        # Skip if the screen changed or a newer resize replaced this one
+        if (getattr(self, '_special_resize_future', None) is not future
+                or getattr(self, 'special_image_path', None) != image_path):
+            return
+        self._special_resize_future = None
         
         try:
-            with open(self.roster_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        parts = line.split(' ', 1)
-                        if len(parts) >= 1:
-                            roster_id = parts[0]
-                            # Normalize roster ID for comparison
-                            normalized_roster_id = str(int(roster_id)) if roster_id.isdigit() else roster_id
-                            
-                            if normalized_id == normalized_roster_id:
-                                # Found the student
-                                return parts[1] if len(parts) > 1 else ""
+            self.special_photo = ImageTk.PhotoImage(future.result())
+            self._special_photos[image_path] = (canvas_size, self.special_photo)
+            
+            # Clear canvas and display image
+            canvas_width, canvas_height = canvas_size
+            self.special_canvas.delete("all")
+            self.special_canvas.create_image(canvas_width // 2, canvas_height // 2, 
+                                           image=self.special_photo, anchor="center")
+            self._special_render_size = canvas_size
         except Exception as e:
-            print(f"Error reading roster: {e}")
-        
-        return None
+            print(f"Error displaying special image: {e}")
     
-    def update_roster(self, student_id, student_name):
-        """Update or add student to roster, keeping numerical order"""
-        if not hasattr(self, 'roster_file'):
+    def refresh_roster(self):
+        """Load the roster into memory, re-reading the file only if it changed since last time"""
+        try:
+            mtime = os.stat(self.roster_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        # Same file, untouched since it was read (or written by us)
+        stamp = (self.roster_file, mtime)
+        if self._roster_stamp == stamp:
             return
         
-        # Read existing roster
         roster = []
-        if os.path.exists(self.roster_file):
+        if mtime is not None:
             try:
                 with open(self.roster_file, 'r') as f:
                     for line in f:
@@ -781,6 +1207,44 @@ class SpeakingTestApp:
             except Exception as e:
                 print(f"Error reading roster: {e}")
         
+        self.set_roster_lines(roster)
+        self._roster_stamp = stamp
+    
+    def set_roster_lines(self, roster):
+        """Store roster lines and index names by normalized student ID"""
+        self._roster_lines = roster
+        # Normalized ID of each line, so updates don't re-parse the roster
+        self._roster_ids = []
+        self._roster_names = {}
+        for line in roster:
+            parts = line.split(' ', 1)
+            roster_id = parts[0]
+            normalized_roster_id = str(int(roster_id)) if roster_id.isdigit() else roster_id
+            self._roster_ids.append(normalized_roster_id)
+            # First entry wins, as with a top-to-bottom scan of the file
+            if normalized_roster_id not in self._roster_names:
+                self._roster_names[normalized_roster_id] = parts[1] if len(parts) > 1 else ""
+    
+    def lookup_student_in_roster(self, student_id):
+        """Look up student name in roster. Returns name or None if not found."""
+        if not hasattr(self, 'roster_file'):
+            return None
+        
+        self.refresh_roster()
+        
+        # Normalize student ID (remove leading zeros for comparison)
+        normalized_id = str(int(student_id)) if student_id.isdigit() else student_id
+        return self._roster_names.get(normalized_id)
+    
+    def update_roster(self, student_id, student_name):
+        """Update or add student to roster, keeping numerical order"""
+        if not hasattr(self, 'roster_file'):
+            return
+        
+        # Existing roster (cached; only re-read if the file changed)
+        self.refresh_roster()
+        roster = self._roster_lines
+        
         # Normalize student ID (pad with leading zero if single digit)
         if student_id.isdigit():
             formatted_id = student_id.zfill(2)
@@ -792,18 +1256,13 @@ class SpeakingTestApp:
         found = False
         updated_roster = []
         
-        for line in roster:
-            parts = line.split(' ', 1)
-            if len(parts) >= 1:
-                roster_id = parts[0]
-                normalized_roster_id = str(int(roster_id)) if roster_id.isdigit() else roster_id
-                
-                if normalized_id == normalized_roster_id:
-                    # Update existing entry
-                    updated_roster.append(f"{formatted_id} {student_name}")
-                    found = True
-                else:
-                    updated_roster.append(line)
+        for line, normalized_roster_id in zip(roster, self._roster_ids):
+            if normalized_id == normalized_roster_id:
+                # Update existing entry
+                updated_roster.append(f"{formatted_id} {student_name}")
+                found = True
+            else:
+                updated_roster.append(line)
         
         # If not found, add new entry
         if not found:
@@ -819,11 +1278,16 @@ class SpeakingTestApp:
         
         updated_roster.sort(key=get_sort_key)
         
-        # Write back to file
+        # Nothing changed - leave the file alone
+        if updated_roster == roster and self._roster_stamp[1] is not None:
+            return
+        
+        # Write back to file in one call (updated_roster always has at least one entry)
         try:
             with open(self.roster_file, 'w') as f:
-                for line in updated_roster:
-                    f.write(line + '\n')
+                f.write('\n'.join(updated_roster) + '\n')
+            self.set_roster_lines(updated_roster)
+            self._roster_stamp = (self.roster_file, os.stat(self.roster_file).st_mtime_ns)
         except Exception as e:
             print(f"Error writing roster: {e}")
     
@@ -831,9 +1295,9 @@ class SpeakingTestApp:
         """Remove invalid characters from folder name"""
         # Remove invisible characters and non-printable characters
         # Keep only alphanumeric, spaces, hyphens, and underscores
-        sanitized = re.sub(r'[^\w\s-]', '', name)
+        sanitized = FOLDER_INVALID_CHARS_RE.sub('', name)
         # Replace multiple spaces with single space
-        sanitized = re.sub(r'\s+', ' ', sanitized)
+        sanitized = WHITESPACE_RUN_RE.sub(' ', sanitized)
         # Strip leading/trailing whitespace
         sanitized = sanitized.strip()
         # Replace spaces with underscores for folder name
@@ -845,6 +1309,9 @@ class SpeakingTestApp:
         self.clear_screen()
         self.current_screen = "class"
         
+        # The class may change from here, so write out this class's scores
+        self.flush_class_summary()
+        
         # Create frame
         frame = tk.Frame(self.root)
         frame.place(relx=0.5, rely=0.5, anchor="center")
@@ -859,8 +1326,8 @@ class SpeakingTestApp:
         self.class_entry.focus_set()
         
         # Bind Enter and Tab
-        self.class_entry.bind("<Return>", lambda e: self.submit_class())
-        self.class_entry.bind("<Tab>", lambda e: self.submit_class())
+        self.class_entry.bind("<Return>", self.entry_submit_handler(self.submit_class))
+        self.class_entry.bind("<Tab>", self.entry_submit_handler(self.submit_class))
         
         # Next button
         btn = tk.Button(frame, text="Next", font=("Arial", 16), 
@@ -873,7 +1340,7 @@ class SpeakingTestApp:
         
         # Use Roster checkbox
         self.use_roster_var = tk.BooleanVar()
-        self.use_roster_var.set(self.use_roster if hasattr(self, 'use_roster') else False)
+        self.use_roster_var.set(self.use_roster)
         
         roster_check = tk.Checkbutton(checkbox_frame, text="Use Roster (track student names)", 
                                      variable=self.use_roster_var, font=("Arial", 11))
@@ -888,7 +1355,7 @@ class SpeakingTestApp:
         
         # Reverse Count checkbox
         self.reverse_count_var = tk.BooleanVar()
-        self.reverse_count_var.set(self.reverse_count if hasattr(self, 'reverse_count') else False)
+        self.reverse_count_var.set(self.reverse_count)
         
         reverse_check = tk.Checkbutton(checkbox_frame, text="Reverse Count (countdown student numbers)", 
                                       variable=self.reverse_count_var, font=("Arial", 11))
@@ -959,16 +1426,18 @@ class SpeakingTestApp:
             f"{self.class_number}_SpeakingTest.{date_str}.txt"
         )
         
-        # Check if class summary file already exists for today
-        if not os.path.exists(self.class_summary_file):
-            # Create new file with header
-            try:
-                with open(self.class_summary_file, 'w') as f:
-                    f.write(f"Class {self.class_number} - Speaking Test Summary\n")
-                    f.write(f"Date: {now.strftime('%Y-%m-%d')}\n")
-                    f.write("=" * 80 + "\n\n")
-            except Exception as e:
-                print(f"Error creating class summary file: {e}")
+        # Create today's class summary file with its header, unless it already exists
+        # ('x' mode checks and creates in one open call)
+        header = (f"Class {self.class_number} - Speaking Test Summary\n"
+                  f"Date: {now.strftime('%Y-%m-%d')}\n"
+                  + "=" * 80 + "\n\n")
+        try:
+            with open(self.class_summary_file, 'x') as f:
+                f.write(header)
+        except FileExistsError:
+            pass
+        except Exception as e:
+            print(f"Error creating class summary file: {e}")
         
         # Set roster file path
         self.roster_file = os.path.join(
@@ -976,14 +1445,15 @@ class SpeakingTestApp:
             f"{self.class_number}_Roster.txt"
         )
         
-        # Create roster file if Use Roster is enabled and file doesn't exist
-        if hasattr(self, 'use_roster') and self.use_roster:
-            if not os.path.exists(self.roster_file):
-                try:
-                    with open(self.roster_file, 'w') as f:
-                        f.write("")  # Create empty roster
-                except Exception as e:
-                    print(f"Error creating roster file: {e}")
+        # Create an empty roster file if Use Roster is enabled and it doesn't exist,
+        # so it's there to fill in by hand
+        if self.use_roster:
+            try:
+                open(self.roster_file, 'x').close()
+            except FileExistsError:
+                pass
+            except Exception as e:
+                print(f"Error creating roster file: {e}")
         
         # Check if there are subfolders in Slides directory
         self.check_for_slide_subfolders()
@@ -992,12 +1462,12 @@ class SpeakingTestApp:
         """Check if there are subfolders in the Slides directory and show selection if needed"""
         subfolders = []
         
-        # Look for subdirectories in Slides folder
-        if os.path.exists(self.slides_folder):
-            for item in os.listdir(self.slides_folder):
-                item_path = os.path.join(self.slides_folder, item)
-                if os.path.isdir(item_path):
-                    subfolders.append(item)
+        # Look for subdirectories in Slides folder (a missing folder just means none)
+        try:
+            with os.scandir(self.slides_folder) as it:
+                subfolders = [entry.name for entry in it if entry.is_dir()]
+        except FileNotFoundError:
+            pass
         
         if len(subfolders) > 0:
             # Multiple subfolders found, show selection screen
@@ -1041,12 +1511,8 @@ class SpeakingTestApp:
         self.folder_listbox.pack(side=tk.LEFT, fill=tk.BOTH)
         scrollbar.config(command=self.folder_listbox.yview)
         
-        # Add "Use Main Slides Folder" option
-        self.folder_listbox.insert(tk.END, "[ Use Main Slides Folder ]")
-        
-        # Add subfolders to listbox
-        for folder in sorted(subfolders):
-            self.folder_listbox.insert(tk.END, folder)
+        # Add "Use Main Slides Folder" option, then the subfolders, in one Tcl call
+        self.folder_listbox.insert(tk.END, "[ Use Main Slides Folder ]", *sorted(subfolders))
         
         # Select first item by default
         self.folder_listbox.select_set(0)
@@ -1075,6 +1541,11 @@ class SpeakingTestApp:
         else:
             self.selected_slides_subfolder = selected_text
         
+        # A different slides folder means different images
+        self._image_cache.clear()
+        self._photo_key = None
+        self._prewarm_futures.clear()
+        
         # Proceed to student entry
         self.show_student_entry()
     
@@ -1107,7 +1578,7 @@ class SpeakingTestApp:
                 last_number = int(self.student_id)
                 
                 # Check if reverse count is enabled
-                if hasattr(self, 'reverse_count') and self.reverse_count:
+                if self.reverse_count:
                     # Countdown - subtract 1, but don't go below 1
                     next_number = max(1, last_number - 1)
                 else:
@@ -1126,8 +1597,8 @@ class SpeakingTestApp:
         self.student_entry.focus_set()
         
         # Bind Enter and Tab
-        self.student_entry.bind("<Return>", lambda e: self.submit_student())
-        self.student_entry.bind("<Tab>", lambda e: self.submit_student())
+        self.student_entry.bind("<Return>", self.entry_submit_handler(self.submit_student))
+        self.student_entry.bind("<Tab>", self.entry_submit_handler(self.submit_student))
         
         # Button
         btn = tk.Button(frame, text="Start Test", font=("Arial", 16), 
@@ -1158,7 +1629,7 @@ class SpeakingTestApp:
             
             # Proceed with test
             # Check if Use Roster is enabled
-            if hasattr(self, 'use_roster') and self.use_roster:
+            if self.use_roster:
                 # Look up student in roster
                 student_name = self.lookup_student_in_roster(self.student_id)
                 self.show_student_name_screen(student_name if student_name else "")
@@ -1174,31 +1645,27 @@ class SpeakingTestApp:
         
         # Look for any file matching the pattern: SpeakingTest_CLASS_STUDENTID_*.txt
         # Need to check various formats of student ID (1, 01, etc.)
-        pattern_ids = [self.student_id]
+        pattern_ids = {self.student_id}
         
-        # If numeric, also check zero-padded version
+        # If numeric, also check zero-padded and unpadded versions
         if self.student_id.isdigit():
-            padded = self.student_id.zfill(2)
-            if padded != self.student_id:
-                pattern_ids.append(padded)
-            # Also check unpadded version
-            unpadded = str(int(self.student_id))
-            if unpadded != self.student_id:
-                pattern_ids.append(unpadded)
-        
-        # Check if class folder exists
-        if not os.path.exists(self.class_folder):
-            return False
+            pattern_ids.add(self.student_id.zfill(2))
+            pattern_ids.add(str(int(self.student_id)))
         
-        # Look for matching files
-        for filename in os.listdir(self.class_folder):
-            if filename.startswith('SpeakingTest_') and filename.endswith('.txt'):
-                # Parse filename: SpeakingTest_CLASS_STUDENTID_TIMESTAMP.txt
-                parts = filename.replace('.txt', '').split('_')
-                if len(parts) >= 3:
-                    file_student_id = parts[2]
-                    if file_student_id in pattern_ids:
-                        return True
+        # Look for matching files, stopping at the first one
+        try:
+            with os.scandir(self.class_folder) as it:
+                for entry in it:
+                    filename = entry.name
+                    if filename.startswith('SpeakingTest_') and filename.endswith('.txt'):
+                        # Parse filename: SpeakingTest_CLASS_STUDENTID_TIMESTAMP.txt
+                        # (only the student ID is needed, so split no further than that)
+                        parts = filename[:-4].split('_', 3)
+                        if len(parts) >= 3 and parts[2] in pattern_ids:
+                            return True
+        except FileNotFoundError:
+            # Class folder doesn't exist yet
+            return False
         
         return False
     
@@ -1290,7 +1757,8 @@ class SpeakingTestApp:
         # Reset last clicked button
         self.last_clicked_button = None
         
-        # Check for Start image
+        # Check for Start image (special images are looked up once per test)
+        self.scan_special_images()
         start_image = self.find_special_image("Start_")
         if start_image:
             # Store the fact that we need to show image screen after Start
@@ -1306,7 +1774,7 @@ class SpeakingTestApp:
     
     def load_images(self):
         """Load all images from the slides folder or selected subfolder in alphabetical order"""
-        self.image_files = {}
+        self.image_files = []
         self.unscored_images = set()  # Track which images should not be scored
         
         # Determine which folder to load images from
@@ -1315,62 +1783,53 @@ class SpeakingTestApp:
         else:
             images_folder = self.slides_folder
         
-        # Supported image formats
-        supported_formats = ['.png', '.jpg', '.jpeg', '.bmp', '.gif']
-        
-        # Check if there are category subfolders
+        # Check if there are category subfolders (one scan also collects the top-level files)
+        # Entries are (lowercased name, path) so a plain sort is alphabetical, case-insensitive
         category_folders = []
-        if os.path.exists(images_folder):
-            for item in os.listdir(images_folder):
-                item_path = os.path.join(images_folder, item)
-                if os.path.isdir(item_path):
-                    category_folders.append((item, item_path))
-        
-        current_index = 0
+        top_level_files = []
+        try:
+            with os.scandir(images_folder) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        category_folders.append((entry.name.lower(), entry.path))
+                    elif entry.is_file():
+                        top_level_files.append((entry.name.lower(), entry.path))
+        except FileNotFoundError:
+            # No slides folder - no images
+            pass
         
         if category_folders:
             # We have category subfolders - load from each in alphabetical order
-            category_folders.sort(key=lambda x: x[0].lower())
+            category_folders.sort()
             
-            for category_name, category_path in category_folders:
+            for _, category_path in category_folders:
                 # Collect all image files in this category
-                category_images = []
-                for file in os.listdir(category_path):
-                    file_path = os.path.join(category_path, file)
-                    if os.path.isfile(file_path):
-                        name, ext = os.path.splitext(file)
-                        if ext.lower() in supported_formats:
-                            category_images.append((file, file_path))
+                with os.scandir(category_path) as it:
+                    category_images = [
+                        (entry.name.lower(), entry.path) for entry in it
+                        if entry.is_file()
+                        and entry.name.lower().endswith(SUPPORTED_IMAGE_FORMATS)
+                    ]
                 
                 # Sort files alphabetically
-                category_images.sort(key=lambda x: x[0].lower())
+                category_images.sort()
+                
+                # Mark first image in each category as unscored
+                if category_images:
+                    self.unscored_images.add(len(self.image_files))
                 
                 # Add to main image list
-                for i, (filename, filepath) in enumerate(category_images):
-                    self.image_files[current_index] = filepath
-                    
-                    # Mark first image in each category as unscored
-                    if i == 0:
-                        self.unscored_images.add(current_index)
-                    
-                    current_index += 1
+                self.image_files.extend(filepath for _, filepath in category_images)
         else:
             # No category folders - load images directly from the folder
-            image_file_list = []
-            if os.path.exists(images_folder):
-                for file in os.listdir(images_folder):
-                    file_path = os.path.join(images_folder, file)
-                    if os.path.isfile(file_path):
-                        name, ext = os.path.splitext(file)
-                        if ext.lower() in supported_formats:
-                            image_file_list.append((file, file_path))
+            image_file_list = [(name, path) for name, path in top_level_files
+                               if name.endswith(SUPPORTED_IMAGE_FORMATS)]
             
             # Sort files alphabetically (case-insensitive)
-            image_file_list.sort(key=lambda x: x[0].lower())
+            image_file_list.sort()
             
-            # Assign sequential numbers starting from 0
-            for index, (filename, filepath) in enumerate(image_file_list):
-                self.image_files[index] = filepath
+            # Image numbers are list positions, starting from 0
+            self.image_files = [filepath for _, filepath in image_file_list]
     
     def create_output_file(self):
         """Create the output text file with timestamp in the class folder"""
@@ -1379,6 +1838,7 @@ class SpeakingTestApp:
         filename = f"SpeakingTest_{self.class_number}_{self.student_id}_{timestamp}.txt"
         
         # Save in the class folder
+        self.close_output_file()
         self.output_file = os.path.join(self.class_folder, filename)
         
         # Create empty file
@@ -1390,84 +1850,81 @@ class SpeakingTestApp:
         self.clear_screen()
         self.current_screen = "image"
         
-        # Create main canvas
+        # Create main canvas (its overlay items are drawn by display_current_image)
         self.canvas = tk.Canvas(self.root, bg="black", highlightthickness=0)
+        self._clock_items = None
+        self._timer_items = None
         self.canvas.pack(fill=tk.BOTH, expand=True)
         
-        # Bind window resize event to redisplay image
-        self.root.bind("<Configure>", self.on_window_resize)
+        # Bind window resize event to redisplay image (the first event always redraws)
+        self._last_size = None
+        self.bind_screen("<Configure>", self.on_window_resize)
         
         # Bind mouse events based on calibrated mapping
+        # (each binding carries its position, so a click needs no lookup)
         for button_event, position in self.mouse_button_map.items():
-            # Extract button number from "Button-X" format
-            button_num = button_event.split('-')[1]
             self.canvas.bind(f"<{button_event}>", 
                            lambda e, pos=position: self.handle_click(pos))
         
         # Bind scroll wheel for Windows
         self.canvas.bind("<MouseWheel>", self.handle_scroll)
         
-        # Bind keyboard keys
-        self.root.bind("<BackSpace>", self.handle_backspace)
-        self.root.bind("<Up>", lambda e: self.go_previous())  # Up arrow - go back
-        self.root.bind("<Down>", lambda e: self.go_next())  # Down arrow - go forward
-        
-        # Bind number keys 1-5 to function like mouse positions 1-5
-        self.root.bind("1", lambda e: self.handle_click(1))
-        self.root.bind("2", lambda e: self.handle_click(2))
-        self.root.bind("3", lambda e: self.handle_click(3))
-        self.root.bind("4", lambda e: self.handle_click(4))
-        self.root.bind("5", lambda e: self.handle_click(5))
-        
-        # Bind Tab to jump to student ID input
-        self.root.bind("<Tab>", lambda e: self.show_student_entry())
-        # Bind Shift+Tab to jump to class input
-        self.root.bind("<Shift-Tab>", lambda e: self.show_class_entry())
-        
+        # Keyboard keys are bound once for the whole app (see bind_test_keys)
         self.canvas.focus_set()
         
         # Initialize elapsed time clock
         self.test_start_time = None
         self.elapsed_seconds = 0
-        self.start_elapsed_clock()
         
         # Initialize timer if enabled
-        if hasattr(self, 'timer_seconds') and self.timer_seconds > 0:
+        if self.timer_seconds > 0:
             self.current_timer_value = self.timer_seconds
-            self.start_countdown_timer()
         else:
             self.current_timer_value = None
+        self._countdown_beeped = False
+        
+        # Start ticking both
+        self.restart_clock_tick()
         
         # Display the current image
         self.display_current_image()
     
-    def start_elapsed_clock(self):
-        """Start the elapsed time clock"""
+    def restart_clock_tick(self):
+        """Run a clock tick now and start the 1-second cycle over from here"""
+        if hasattr(self, 'clock_tick_id'):
+            self.root.after_cancel(self.clock_tick_id)
+        self.tick_clocks()
+    
+    def tick_clocks(self):
+        """
+        Update the elapsed time clock and the countdown timer, once a second.
+        One after() loop drives both; restart_clock_tick starts it over on each
+        answer, so the countdown still counts whole seconds from the click.
+        """
         if self.test_start_time is None:
             self.test_start_time = datetime.now()
         
-        if self.current_screen == "image":
-            # Calculate elapsed time
-            elapsed = datetime.now() - self.test_start_time
-            self.elapsed_seconds = int(elapsed.total_seconds())
-            
-            # Schedule next update
-            self.elapsed_clock_id = self.root.after(1000, self.start_elapsed_clock)
-            
-            # Redisplay to update clock
-            self.display_current_image()
-    
-    def start_countdown_timer(self):
-        """Start the countdown timer"""
-        if self.current_screen == "image" and self.current_timer_value is not None:
+        if self.current_screen != "image":
+            return
+        
+        # Overlays whose value changes on this tick
+        changed = []
+        
+        # Calculate elapsed time
+        elapsed = datetime.now() - self.test_start_time
+        elapsed_seconds = int(elapsed.total_seconds())
+        if elapsed_seconds != self.elapsed_seconds:
+            self.elapsed_seconds = elapsed_seconds
+            changed.append(self.draw_clock_overlay)
+        
+        # Count down; once at zero it stays there (and turns green),
+        # so later ticks leave the timer alone
+        if self.current_timer_value is not None:
             if self.current_timer_value > 0:
                 self.current_timer_value -= 1
-                # Schedule next countdown
-                self.timer_id = self.root.after(1000, self.start_countdown_timer)
-                # Redisplay to update timer
-                self.display_current_image()
-            elif self.current_timer_value == 0:
-                # Timer just reached zero - beep!
+                changed.append(self.draw_timer_overlay)
+            elif not self._countdown_beeped:
+                # Timer reached zero - beep!
                 try:
                     import winsound
                     winsound.Beep(1000, 200)  # 1000 Hz for 200ms
@@ -1477,22 +1934,33 @@ class SpeakingTestApp:
                         print('\a')  # ASCII bell character
                     except:
                         pass
-                # Don't count down below zero, just stay at 0
-                # Redisplay to update timer color
-                self.display_current_image()
-            # If it reaches 0, it just stops (stays at 0 and turns green)
+                self._countdown_beeped = True
+        
+        # Schedule next update
+        self.clock_tick_id = self.root.after(1000, self.tick_clocks)
+        
+        # Update just the clock and timer, not the slide
+        self.refresh_overlay(*changed)
     
     def on_window_resize(self, event):
         """Handle window resize events - redisplay the current image"""
         # Only redisplay if we're on the image screen and the canvas still exists
         if self.current_screen == "image" and hasattr(self, 'canvas'):
+            # The binding is on root, so skip events from its child widgets
+            if event.widget is not self.root:
+                return
+            # Moves and other same-size events don't need a redraw
+            size = (event.width, event.height)
+            if size == self._last_size:
+                return
+            self._last_size = size
             try:
                 # Check if canvas still exists and is valid
                 self.canvas.winfo_exists()
                 # Add a small delay to avoid excessive redraws during resize
                 if hasattr(self, '_resize_timer'):
                     self.root.after_cancel(self._resize_timer)
-                self._resize_timer = self.root.after(100, self.display_current_image)
+                self._resize_timer = self.root.after(RESIZE_DEBOUNCE_MS, self.display_current_image)
             except tk.TclError:
                 # Canvas was destroyed, ignore
                 pass
@@ -1511,7 +1979,7 @@ class SpeakingTestApp:
             return
         
         # Check if current image index is valid
-        max_index = max(self.image_files.keys(), default=-1)
+        max_index = len(self.image_files) - 1
         
         # If current index is beyond the max, loop to the last image
         if self.current_image_index > max_index:
@@ -1525,41 +1993,53 @@ class SpeakingTestApp:
         if self.current_image_index < 0:
             self.current_image_index = 0
         
-        if self.current_image_index not in self.image_files:
+        if self.current_image_index >= len(self.image_files):
             messagebox.showerror("Error", f"Image {self.current_image_index} not found!")
             return
         
-        # Load image
-        image_path = self.image_files[self.current_image_index]
-        image = Image.open(image_path)
-        
         # Resize to fit window while maintaining aspect ratio
         canvas_width = self.root.winfo_width()
         canvas_height = self.root.winfo_height()
         
-        # Get image dimensions
-        img_width, img_height = image.size
-        
-        # Calculate scaling factor
-        width_ratio = canvas_width / img_width
-        height_ratio = canvas_height / img_height
-        scale = min(width_ratio, height_ratio)  # Allow upscaling
-        
-        new_width = int(img_width * scale)
-        new_height = int(img_height * scale)
-        
-        image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        image_path = self.image_files[self.current_image_index]
         
-        # Convert to PhotoImage
-        self.photo = ImageTk.PhotoImage(image)
+        # Use the slide scaled ahead of time on the worker thread if it's ready
+        scaled = None
+        prewarmed = self._prewarm_futures.get((image_path, canvas_width, canvas_height))
+        if prewarmed is not None and prewarmed.done() and prewarmed.exception() is None:
+            scaled = prewarmed.result()
+            new_width, new_height = scaled.size
+        else:
+            # Load image (decoded once, then reused on every redraw)
+            image = self.get_cached_image(image_path, (canvas_width, canvas_height))
+            new_width, new_height = fit_size(image.size, (canvas_width, canvas_height))
+        
+        # Only resize when the slide or its display size changed
+        photo_key = (image_path, new_width, new_height)
+        if photo_key != self._photo_key:
+            if scaled is None:
+                scaled = resize_lanczos(image, (new_width, new_height))
+            
+            # Convert to PhotoImage, reusing the current one when the new slide
+            # has the same size and mode (only its pixels are replaced)
+            shape = (scaled.size, scaled.mode)
+            if shape == self._photo_shape:
+                self.photo.paste(scaled)
+            else:
+                self.photo = ImageTk.PhotoImage(scaled)
+                self._photo_shape = shape
+            self._photo_key = photo_key
         
-        # Clear canvas and display image
+        # Clear canvas and display image (overlay items are created again below)
         self.canvas.delete("all")
+        self._clock_items = None
+        self._timer_items = None
+        self._overlay_width = canvas_width
         self.canvas.create_image(canvas_width // 2, canvas_height // 2, 
                                 image=self.photo, anchor="center")
         
         # Display last clicked button number in lower left corner
-        if hasattr(self, 'last_clicked_button') and self.last_clicked_button is not None:
+        if self.last_clicked_button is not None:
             # Create background rectangle
             padding = 5
             text_x = 10 + padding
@@ -1568,8 +2048,8 @@ class SpeakingTestApp:
             # Create text (will be used to measure size)
             text = f"{self.last_clicked_button}"
             
-            # Estimate text size (approximate)
-            text_width = len(text) * 8  # Rough estimate for 12pt font
+            # Measure text size
+            text_width = self.text_width(BUTTON_FONT, text)
             text_height = 16
             
             # Draw light grey background rectangle
@@ -1587,22 +2067,22 @@ class SpeakingTestApp:
                 text_x,
                 text_y - text_height // 2,
                 text=text,
-                font=("Arial", 12),
+                font=BUTTON_FONT,
                 fill="black",
                 anchor="w"
             )
         
         # Display point value in lower right corner
-        if hasattr(self, 'last_clicked_button') and self.last_clicked_button is not None:
-            if hasattr(self, 'point_values') and self.last_clicked_button in self.point_values:
+        if self.last_clicked_button is not None:
+            if self.last_clicked_button in self.point_values:
                 points = self.point_values[self.last_clicked_button]
                 
                 # Create background rectangle
                 padding = 5
                 text = f"{points}"  # Just the number, no "pts"
                 
-                # Estimate text size
-                text_width = len(text) * 8
+                # Measure text size
+                text_width = self.text_width(BUTTON_FONT, text)
                 text_height = 16
                 
                 text_x = canvas_width - 10 - text_width - padding
@@ -1623,50 +2103,19 @@ class SpeakingTestApp:
                     text_x + padding,
                     text_y - text_height // 2,
                     text=text,
-                    font=("Arial", 12),
+                    font=BUTTON_FONT,
                     fill="black",
                     anchor="w"
                 )
         
         # Display elapsed time clock in upper left corner
-        if hasattr(self, 'elapsed_seconds'):
-            # Format as MM:SS
-            minutes = self.elapsed_seconds // 60
-            seconds = self.elapsed_seconds % 60
-            clock_text = f"{minutes:02d}:{seconds:02d}"
-            
-            padding = 5
-            text_width = len(clock_text) * 15  # Estimate for 24pt font
-            text_height = 28
-            
-            text_x = 10 + padding
-            text_y = 10 + padding
-            
-            # Draw light grey background rectangle
-            self.canvas.create_rectangle(
-                text_x - padding,
-                text_y - padding,
-                text_x + text_width + padding,
-                text_y + text_height + padding,
-                fill="lightgrey",
-                outline=""
-            )
-            
-            # Draw black text
-            self.canvas.create_text(
-                text_x,
-                text_y + text_height // 2,
-                text=clock_text,
-                font=("Arial", 24),
-                fill="black",
-                anchor="w"
-            )
+        self.draw_clock_overlay()
         
         # Display "UNSCORED" indicator for category intro slides (center top)
-        if hasattr(self, 'unscored_images') and self.current_image_index in self.unscored_images:
+        if self.current_image_index in self.unscored_images:
             unscored_text = "UNSCORED"
             padding = 8
-            text_width = len(unscored_text) * 18  # Estimate for 28pt bold font
+            text_width = self.text_width(UNSCORED_FONT, unscored_text)
             text_height = 32
             
             # Center horizontally
@@ -1689,61 +2138,194 @@ class SpeakingTestApp:
                 text_x,
                 text_y + text_height // 2 - padding,
                 text=unscored_text,
-                font=("Arial", 28, "bold"),
+                font=UNSCORED_FONT,
                 fill="black",
                 anchor="center"
             )
         
         # Display countdown timer in upper right corner
-        if hasattr(self, 'current_timer_value') and self.current_timer_value is not None:
-            padding = 5
-            timer_text = str(self.current_timer_value)
-            
-            # Estimate text size for size 24 font
-            text_width = len(timer_text) * 15  # Rough estimate for 24pt font
-            text_height = 28
-            
-            text_x = canvas_width - 10 - text_width - padding
-            text_y = 10 + padding
-            
-            # Determine colors based on timer value
-            if self.current_timer_value > 0:
-                # Use start colors
-                text_color = self.timer_start_text_color if hasattr(self, 'timer_start_text_color') else '#000000'
-                bg_color = self.timer_start_bg_color if hasattr(self, 'timer_start_bg_color') else '#D3D3D3'
-            else:
-                # Use end colors (at zero)
-                text_color = self.timer_end_text_color if hasattr(self, 'timer_end_text_color') else '#00FF00'
-                bg_color = self.timer_end_bg_color if hasattr(self, 'timer_end_bg_color') else '#D3D3D3'
-            
-            # Draw background rectangle
-            self.canvas.create_rectangle(
-                text_x - padding,
-                text_y - padding,
-                text_x + text_width + padding * 2,
-                text_y + text_height + padding,
-                fill=bg_color,
-                outline=""
-            )
-            
-            # Draw timer text
-            self.canvas.create_text(
-                text_x + padding,
-                text_y + text_height // 2,
-                text=timer_text,
-                font=("Arial", 24),
-                fill=text_color,
-                anchor="w"
-            )
+        self.draw_timer_overlay()
+        
+        # Get the next slides ready while this one is on screen
+        self.prewarm_next_slides((canvas_width, canvas_height))
+    
+    def prewarm_next_slides(self, canvas_size):
+        """
+        Scale the next PREWARM_SLIDES slides to canvas_size on the worker thread,
+        so moving forward only has to swap the PhotoImage. Results for slides
+        already passed or for an old window size are dropped.
+        """
+        start = self.current_image_index + 1
+        wanted = [(path,) + canvas_size for path in self.image_files[start:start + PREWARM_SLIDES]]
+        
+        for key in list(self._prewarm_futures):
+            if key not in wanted:
+                self._prewarm_futures.pop(key).cancel()
+        
+        for key in wanted:
+            if key not in self._prewarm_futures:
+                self._prewarm_futures[key] = self._resize_pool.submit(
+                    prescale_image, key[0], canvas_size, self._image_bound)
+    
+    def text_width(self, font, text):
+        """
+        Width in pixels of text drawn in font. Each character is measured once
+        with Tk and cached, so the overlays' 1-second updates don't ask Tk again.
+        """
+        metrics = self._font_metrics.get(font)
+        if metrics is None:
+            metrics = self._font_metrics[font] = (tkfont.Font(root=self.root, font=font), {})
+        measure, widths = metrics[0].measure, metrics[1]
+        
+        total = 0
+        for char in text:
+            width = widths.get(char)
+            if width is None:
+                width = widths[char] = measure(char)
+            total += width
+        return total
+    
+    def draw_clock_overlay(self):
+        """
+        Draw the elapsed time clock in the upper left corner, or update the
+        one already on the canvas (so the 1-second tick doesn't redraw the slide)
+        """
+        if self.elapsed_seconds is None:
+            return
+        
+        # Format as MM:SS
+        minutes = self.elapsed_seconds // 60
+        seconds = self.elapsed_seconds % 60
+        clock_text = f"{minutes:02d}:{seconds:02d}"
+        
+        padding = 5
+        text_width = self.text_width(CLOCK_FONT, clock_text)
+        text_height = 28
+        
+        text_x = 10 + padding
+        text_y = 10 + padding
+        
+        box = (text_x - padding,
+               text_y - padding,
+               text_x + text_width + padding,
+               text_y + text_height + padding)
+        
+        if self._clock_items is not None:
+            bg_id, text_id, drawn_box = self._clock_items
+            # Leave the background alone unless it changes size, so Tk only
+            # repaints the text's area on a tick
+            if box != drawn_box:
+                self.canvas.coords(bg_id, *box)
+                self._clock_items = (bg_id, text_id, box)
+            self.canvas.itemconfig(text_id, text=clock_text)
+            return
+        
+        # Draw light grey background rectangle
+        bg_id = self.canvas.create_rectangle(
+            *box,
+            fill="lightgrey",
+            outline=""
+        )
+        
+        # Draw black text
+        text_id = self.canvas.create_text(
+            text_x,
+            text_y + text_height // 2,
+            text=clock_text,
+            font=CLOCK_FONT,
+            fill="black",
+            anchor="w"
+        )
+        self._clock_items = (bg_id, text_id, box)
+    
+    def draw_timer_overlay(self):
+        """
+        Draw the countdown timer in the upper right corner, or update the one
+        already on the canvas (text, colors and position for the new value)
+        """
+        if self.current_timer_value is None:
+            return
+        
+        canvas_width = self._overlay_width
+        padding = 5
+        timer_text = str(self.current_timer_value)
+        
+        # Measure text size
+        text_width = self.text_width(CLOCK_FONT, timer_text)
+        text_height = 28
+        
+        text_x = canvas_width - 10 - text_width - padding
+        text_y = 10 + padding
+        
+        # Determine colors based on timer value
+        if self.current_timer_value > 0:
+            # Use start colors
+            text_color = self.timer_start_text_color
+            bg_color = self.timer_start_bg_color
+        else:
+            # Use end colors (at zero)
+            text_color = self.timer_end_text_color
+            bg_color = self.timer_end_bg_color
+        
+        box = (text_x - padding,
+               text_y - padding,
+               text_x + text_width + padding * 2,
+               text_y + text_height + padding)
+        text_pos = (text_x + padding, text_y + text_height // 2)
+        
+        if self._timer_items is not None:
+            bg_id, text_id, drawn_box, drawn_bg = self._timer_items
+            # Only change what differs from the last tick (the background
+            # usually stays put), so Tk repaints as little as possible
+            if box != drawn_box:
+                self.canvas.coords(bg_id, *box)
+                self.canvas.coords(text_id, *text_pos)
+            if bg_color != drawn_bg:
+                self.canvas.itemconfig(bg_id, fill=bg_color)
+            self.canvas.itemconfig(text_id, text=timer_text, fill=text_color)
+            self._timer_items = (bg_id, text_id, box, bg_color)
+            return
+        
+        # Draw background rectangle
+        bg_id = self.canvas.create_rectangle(
+            *box,
+            fill=bg_color,
+            outline=""
+        )
+        
+        # Draw timer text
+        text_id = self.canvas.create_text(
+            *text_pos,
+            text=timer_text,
+            font=CLOCK_FONT,
+            fill=text_color,
+            anchor="w"
+        )
+        self._timer_items = (bg_id, text_id, box, bg_color)
+    
+    def refresh_overlay(self, *draw_overlays):
+        """
+        Update the given overlays for a clock/timer tick. Falls back to a full
+        redraw when the overlays aren't on the canvas yet.
+        """
+        if self._clock_items is None and self._timer_items is None:
+            self.display_current_image()
+            return
+        try:
+            for draw_overlay in draw_overlays:
+                draw_overlay()
+        except tk.TclError:
+            # Canvas was destroyed, ignore
+            pass
     
     def handle_click(self, button):
         """Handle mouse button clicks"""
         # Check if this is the last image
-        max_image_index = max(self.image_files.keys(), default=0)
+        max_image_index = max(len(self.image_files) - 1, 0)
         is_last_image = (self.current_image_index == max_image_index)
         
         # Only record if this image is NOT marked as unscored
-        if not (hasattr(self, 'unscored_images') and self.current_image_index in self.unscored_images):
+        if self.current_image_index not in self.unscored_images:
             # Record the click for current image
             self.save_record(self.current_image_index, button)
         
@@ -1753,10 +2335,8 @@ class SpeakingTestApp:
         # Move to next image or show score summary
         if is_last_image:
             # Cancel timers
-            if hasattr(self, 'timer_id'):
-                self.root.after_cancel(self.timer_id)
-            if hasattr(self, 'elapsed_clock_id'):
-                self.root.after_cancel(self.elapsed_clock_id)
+            if hasattr(self, 'clock_tick_id'):
+                self.root.after_cancel(self.clock_tick_id)
             
             # Last image - check for PreScore image, then show score summary
             prescore_image = self.find_special_image("PreScore_")
@@ -1768,59 +2348,46 @@ class SpeakingTestApp:
             self.current_image_index += 1
             
             # Reset timer for next image
-            if hasattr(self, 'timer_seconds') and self.timer_seconds > 0:
-                # Cancel previous timer
-                if hasattr(self, 'timer_id'):
-                    self.root.after_cancel(self.timer_id)
+            if self.timer_seconds > 0:
                 # Reset timer value
                 self.current_timer_value = self.timer_seconds
-                # Start countdown again
-                self.start_countdown_timer()
+                self._countdown_beeped = False
+                # Start countdown again (restarting the shared tick)
+                self.restart_clock_tick()
             
             self.display_current_image()
     
-    def calculate_score(self):
-        """Calculate the student's score from the output file"""
-        # Read the output file
-        try:
-            with open(self.output_file, 'r') as f:
-                lines = f.readlines()
-        except:
-            return 0, 0, 0  # score, max_score, percentage
-        
+    def read_question_scores(self):
+        """
+        Read the latest points for each question from the output file.
+        Returns: {question_num: points} (empty if the file can't be read)
+        """
         # Parse lines and get the latest entry for each question
         question_scores = {}  # question_num: points
         
-        for line in lines:
-            # Parse format: "Question 00: 5 = 1 0 0 0 0 filename"
-            if line.startswith("Question"):
-                parts = line.split(":")
-                if len(parts) >= 2:
-                    # Get question number
-                    q_num_str = parts[0].replace("Question", "").strip()
-                    try:
-                        q_num = int(q_num_str)
-                    except:
-                        continue
-                    
-                    # Get point value (between : and =)
-                    rest = parts[1].strip()
-                    if "=" in rest:
-                        point_str = rest.split("=")[0].strip()
-                        try:
-                            points = int(point_str)
-                            # Store this score (overwrites previous if exists)
-                            question_scores[q_num] = points
-                        except:
-                            continue
+        # Read the output file a line at a time
+        try:
+            with open(self.output_file, 'r') as f:
+                for line in f:
+                    # Parse format: "Question 00: 5 = 1 0 0 0 0 filename"
+                    match = QUESTION_LINE_RE.match(line)
+                    if match:
+                        # Store this score (overwrites previous if exists)
+                        question_scores[int(match.group(1))] = int(match.group(2))
+        except:
+            return {}
         
+        return question_scores
+    
+    def calculate_score(self, question_scores):
+        """Calculate the student's score from read_question_scores() results"""
         # Calculate total score and max possible score
         num_questions = len(question_scores)
         if num_questions == 0:
             return 0, 0, 0
         
         # Get max point value (highest configured point value)
-        max_point_value = max(self.point_values.values()) if hasattr(self, 'point_values') and self.point_values else 5
+        max_point_value = max(self.point_values.values()) if self.point_values else 5
         
         total_score = sum(question_scores.values())
         max_score = num_questions * max_point_value
@@ -1838,11 +2405,12 @@ class SpeakingTestApp:
         self.clear_screen()
         self.current_screen = "score_summary"
         
-        # Calculate score
-        total_score, max_score, percentage = self.calculate_score()
+        # Calculate score (the file is parsed once for both the score and the header)
+        question_scores = self.read_question_scores()
+        total_score, max_score, percentage = self.calculate_score(question_scores)
         
         # Add header to the output file
-        self.add_header_to_output_file(total_score, max_score, percentage)
+        self.add_header_to_output_file(total_score, max_score, percentage, question_scores)
         
         # Add entry to class summary file
         self.add_to_class_summary(total_score, max_score, percentage)
@@ -1880,7 +2448,7 @@ class SpeakingTestApp:
         continue_btn.pack(side=tk.BOTTOM, pady=30)
         
         # Also bind Enter key to continue
-        self.root.bind("<Return>", lambda e: self.continue_after_score())
+        self.bind_screen("<Return>", lambda e: self.continue_after_score())
         
         # Bind mouse click anywhere to continue
         frame.bind("<Button-1>", lambda e: self.continue_after_score())
@@ -1923,32 +2491,28 @@ class SpeakingTestApp:
                 # Create line with aligned columns
                 line = f"{timestamp}:   Student {student_display} {name_display}:  {score_display} = {percent_display}\n"
                 
-                with open(self.class_summary_file, 'a') as f:
-                    f.write(line)
+                self._class_summary_buffer.append((self.class_summary_file, line))
         except Exception as e:
             print(f"Error adding to class summary: {e}")
     
-    def add_header_to_output_file(self, total_score, max_score, percentage):
-        """Add header with summary information and point scale to the output file"""
+    def flush_class_summary(self):
+        """Append the buffered class summary lines, one write per summary file"""
+        buffer, self._class_summary_buffer = self._class_summary_buffer, []
+        for summary_file, entries in groupby(buffer, key=itemgetter(0)):
+            try:
+                with open(summary_file, 'a') as f:
+                    f.write(''.join(line for _, line in entries))
+            except Exception as e:
+                print(f"Error adding to class summary: {e}")
+    
+    def add_header_to_output_file(self, total_score, max_score, percentage, question_scores):
+        """
+        Add header with summary information and point scale to the output file.
+        question_scores: {question_num: points} from read_question_scores
+        """
         try:
-            # Read existing content
-            with open(self.output_file, 'r') as f:
-                existing_content = f.read()
-            
             # Count total questions (unique question numbers)
-            question_nums = set()
-            for line in existing_content.split('\n'):
-                if line.startswith("Question"):
-                    parts = line.split(":")
-                    if len(parts) >= 1:
-                        q_num_str = parts[0].replace("Question", "").strip()
-                        try:
-                            q_num = int(q_num_str)
-                            question_nums.add(q_num)
-                        except:
-                            pass
-            
-            total_questions = len(question_nums)
+            total_questions = len(question_scores)
             
             # Get the filename for the header
             filename = os.path.basename(self.output_file)
@@ -1973,35 +2537,45 @@ class SpeakingTestApp:
             header += f"Total Questions: {total_questions}   Max Score: {max_score}   Score: {total_score}   Percentage: {percentage}%\n"
             header += "=" * 67 + "\n"
             
-            # Add point scale (sorted by point value, descending)
-            if hasattr(self, 'point_values') and hasattr(self, 'point_names'):
-                # Create list of (points, name, position) tuples
-                point_scale = []
-                for position in range(1, 6):
-                    points = self.point_values.get(position, 0)
-                    name = self.point_names.get(position, "")
-                    
-                    # Include if: points != 0 OR name is not empty
-                    if points != 0 or name:
-                        point_scale.append((points, name, position))
-                
-                # Sort by points (descending), then by position if tied
-                point_scale.sort(key=lambda x: (-x[0], x[2]))
-                
-                # Add to header
-                for points, name, position in point_scale:
-                    header += f"{points} = {name}\n"
-            
-            header += "\n"
+            # Add point scale
+            header += self.get_point_scale_block()
             
-            # Write header + existing content
-            with open(self.output_file, 'w') as f:
-                f.write(header + existing_content)
+            # Write header, then copy the existing content after it, into a
+            # new file that replaces the old one
+            temp_file = self.output_file + ".tmp"
+            with open(self.output_file, 'r') as src, open(temp_file, 'w') as f:
+                f.write(header)
+                shutil.copyfileobj(src, f)
+            os.replace(temp_file, self.output_file)
                 
         except Exception as e:
             # If there's an error, just continue without adding header
             print(f"Error adding header: {e}")
     
+    def get_point_scale_block(self):
+        """
+        Point scale lines for the output file header ("5 = Correct", ...), followed
+        by a blank line. Built once and reused until the point values or names change.
+        """
+        if self._point_scale_block is None:
+            # Add point scale (sorted by point value, descending)
+            # Create list of (points, name, position) tuples
+            point_scale = []
+            for position in range(1, 6):
+                points = self.point_values.get(position, 0)
+                name = self.point_names.get(position, "")
+                
+                # Include if: points != 0 OR name is not empty
+                if points != 0 or name:
+                    point_scale.append((points, name, position))
+            
+            # Sort by points (descending), then by position if tied
+            point_scale.sort(key=lambda x: (-x[0], x[2]))
+            
+            self._point_scale_block = "".join(f"{points} = {name}\n"
+                                              for points, name, position in point_scale) + "\n"
+        return self._point_scale_block
+    
     def handle_scroll(self, event):
         """Handle mouse wheel scrolling on Windows"""
         if event.delta > 0:
@@ -2020,7 +2594,7 @@ class SpeakingTestApp:
     
     def go_next(self):
         """Navigate to next image"""
-        max_index = max(self.image_files.keys(), default=0)
+        max_index = max(len(self.image_files) - 1, 0)
         if self.current_image_index < max_index:
             self.current_image_index += 1
             self.display_current_image()
@@ -2033,13 +2607,13 @@ class SpeakingTestApp:
         clicks[button - 1] = 1
         
         # Get the point value for this button
-        if hasattr(self, 'point_values') and button in self.point_values:
+        if button in self.point_values:
             points = self.point_values[button]
         else:
             points = 0
         
         # Get the filename without extension
-        if image_num in self.image_files:
+        if 0 <= image_num < len(self.image_files):
             filepath = self.image_files[image_num]
             filename = os.path.basename(filepath)
             filename_no_ext = os.path.splitext(filename)[0]
@@ -2048,9 +2622,17 @@ class SpeakingTestApp:
         
         line = f"Question {image_num:02d}: {points} = {' '.join(map(str, clicks))} {filename_no_ext}\n"
         
-        # Append to file
-        with open(self.output_file, 'a') as f:
-            f.write(line)
+        # Append to file, opened once per test; line buffering still writes
+        # each answer to disk right away
+        if self._output_handle is None:
+            self._output_handle = open(self.output_file, 'a', buffering=1)
+        self._output_handle.write(line)
+    
+    def close_output_file(self):
+        """Close the output file left open by save_record (reopened on the next answer)"""
+        if self._output_handle is not None:
+            self._output_handle.close()
+            self._output_handle = None
     
     def handle_backspace(self, event):
         """Handle backspace key - go back and delete last recorded line"""
@@ -2068,17 +2650,22 @@ class SpeakingTestApp:
     def delete_last_line(self):
         """Delete the last line from the output file"""
         try:
-            # Read all lines from the file
-            with open(self.output_file, 'r') as f:
-                lines = f.readlines()
-            
-            # If there are lines to delete, remove the last one
-            if lines:
-                lines = lines[:-1]
+            with open(self.output_file, 'rb+') as f:
+                # Scan back from the end (skipping the last line's own newline)
+                # for the newline that ends the line before it
+                end = f.seek(0, os.SEEK_END) - 1
+                cut = 0
+                while end > 0:
+                    start = max(0, end - 4096)
+                    f.seek(start)
+                    pos = f.read(end - start).rfind(b'\n')
+                    if pos != -1:
+                        cut = start + pos + 1
+                        break
+                    end = start
                 
-                # Write back all lines except the last one
-                with open(self.output_file, 'w') as f:
-                    f.writelines(lines)
+                # Drop the last line by cutting the file off where it starts
+                f.truncate(cut)
         except Exception as e:
             # If file doesn't exist yet or other error, just continue
             pass
@@ -2092,72 +2679,55 @@ class SpeakingTestApp:
     
     def clear_screen(self):
         """Clear all widgets from the screen"""
-        # Cancel any pending resize timer
-        if hasattr(self, '_resize_timer'):
-            try:
-                self.root.after_cancel(self._resize_timer)
-            except:
-                pass
-            delattr(self, '_resize_timer')
-        
-        # Cancel any pending special image resize timer
-        if hasattr(self, '_special_resize_timer'):
-            try:
-                self.root.after_cancel(self._special_resize_timer)
-            except:
-                pass
-            delattr(self, '_special_resize_timer')
+        # Cancel any pending resize, special image resize and clock/timer tick
+        # (popping each attribute removes it and returns its id in one step)
+        for timer_name in ('_resize_timer', '_special_resize_timer', '_special_finalize_timer',
+                           '_special_poll_timer', 'clock_tick_id'):
+            timer_id = self.__dict__.pop(timer_name, None)
+            if timer_id is not None:
+                try:
+                    self.root.after_cancel(timer_id)
+                except tk.TclError:
+                    pass
+        self._special_resize_future = None
         
-        # Cancel any running countdown timer
-        if hasattr(self, 'timer_id'):
-            try:
-                self.root.after_cancel(self.timer_id)
-            except:
-                pass
-            delattr(self, 'timer_id')
+        # Leaving the test screen - stop appending answers
+        self.close_output_file()
         
-        # Cancel any running elapsed clock
-        if hasattr(self, 'elapsed_clock_id'):
+        # Clean up special image references
+        for name in ('special_image_path', 'special_image_next_action', 'special_canvas',
+                     'special_photo', '_special_render_size'):
+            self.__dict__.pop(name, None)
+        
+        # Remove this screen's root bindings. Passing the funcid makes unbind
+        # delete the callback's Tcl command too, so screens don't leak one each time
+        bindings, self._screen_bindings = self._screen_bindings, []
+        for sequence, funcid in bindings:
             try:
-                self.root.after_cancel(self.elapsed_clock_id)
-            except:
+                self.root.unbind(sequence, funcid)
+            except tk.TclError:
                 pass
-            delattr(self, 'elapsed_clock_id')
-        
-        # Clean up special image references
-        if hasattr(self, 'special_image_path'):
-            delattr(self, 'special_image_path')
-        if hasattr(self, 'special_image_next_action'):
-            delattr(self, 'special_image_next_action')
-        if hasattr(self, 'special_canvas'):
-            delattr(self, 'special_canvas')
-        if hasattr(self, 'special_photo'):
-            delattr(self, 'special_photo')
         
         # Unbind all common event bindings to prevent errors and conflicts
+        # (the test keys from bind_test_keys stay bound and check the screen)
         try:
-            self.root.unbind("<Configure>")
-            self.root.unbind("<Return>")
-            self.root.unbind("<Tab>")
-            self.root.unbind("<Shift-Tab>")
-            self.root.unbind("<BackSpace>")
-            self.root.unbind("<Up>")
-            self.root.unbind("<Down>")
-            self.root.unbind("<Key>")
-            self.root.unbind("1")
-            self.root.unbind("2")
-            self.root.unbind("3")
-            self.root.unbind("4")
-            self.root.unbind("5")
-        except:
+            for sequence in SCREEN_UNBIND_SEQUENCES:
+                self.root.unbind(sequence)
+        except tk.TclError:
             pass
         
+        # Kept settings screens are only hidden; everything else is destroyed
+        kept = set(self._kept_screens.values())
         for widget in self.root.winfo_children():
-            widget.destroy()
+            if widget in kept:
+                widget.pack_forget()
+            else:
+                widget.destroy()
 
 
 def main():
     """Main entry point with error handling"""
+    root = None
     try:
         root = tk.Tk()
         app = SpeakingTestApp(root)
@@ -2170,17 +2740,32 @@ def main():
         
         # Try to show in messagebox
         try:
-            root = tk.Tk()
-            root.withdraw()  # Hide the main window
-            messagebox.showerror("Speaking Test Error", error_msg)
-        except:
+            # Reuse the app's window if it is still alive, rather than starting a second Tk
+            if root is not None:
+                try:
+                    root.withdraw()  # Hide the main window
+                except tk.TclError:
+                    root = None  # Already destroyed
+            if root is None:
+                root = tk.Tk()
+                root.withdraw()
+            messagebox.showerror("Speaking Test Error", error_msg, parent=root)
+        except Exception as dialog_error:
             # If messagebox fails, print to console and wait
+            sys.stderr.write(f"Could not show the error dialog: {dialog_error}\n")
             print("=" * 80)
             print("ERROR IN SPEAKING TEST APPLICATION")
             print("=" * 80)
             print(error_msg)
             print("=" * 80)
             input("\nPress Enter to exit...")
+    finally:
+        # Always tear down the Tk interpreter (it may already be gone after a normal close)
+        if root is not None:
+            try:
+                root.destroy()
+            except tk.TclError:
+                pass
 
 
 if __name__ == "__main__":